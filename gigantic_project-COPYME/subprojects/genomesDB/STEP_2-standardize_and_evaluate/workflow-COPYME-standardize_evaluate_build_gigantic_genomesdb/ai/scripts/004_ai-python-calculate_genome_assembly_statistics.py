@@ -48,6 +48,14 @@ from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Emit an INFO progress line every N completed genomes (per-genome detail is DEBUG)
+PROGRESS_LOG_INTERVAL = 50
+
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -478,7 +486,12 @@ Notes:
         logger.error( "Run script 002 (genome phyloname standardization) before this script." )
         sys.exit( 1 )
 
-    genome_files = sorted( input_genomes_directory.glob( '*.fasta' ) )
+    # os.scandir avoids building a Path object (and running fnmatch) for every entry
+    with os.scandir( input_genomes_directory ) as directory_entries:
+        genome_files = sorted(
+            entry.path for entry in directory_entries
+            if entry.is_file() and entry.name.endswith( '.fasta' )
+        )
 
     if not genome_files:
         logger.error( f"CRITICAL ERROR: No .fasta files found in: {input_genomes_directory}" )
@@ -502,7 +515,7 @@ Notes:
     genome_tasks = []
 
     for genome_file in genome_files:
-        filename = genome_file.name
+        filename = os.path.basename( genome_file )
         phyloname = extract_phyloname_from_filename( filename, logger )
 
         if phyloname not in phylonames___genus_species:
@@ -515,7 +528,7 @@ Notes:
         assembly_identifier = filename[ : -len( '.fasta' ) ]
 
         genome_tasks.append( {
-            'genome_file': genome_file,
+            'genome_file': Path( genome_file ),
             'phyloname': phyloname,
             'genus_species': genus_species,
             'assembly_identifier': assembly_identifier
@@ -578,7 +591,10 @@ Notes:
                 entry = future.result()
                 results_entries.append( entry )
 
-                logger.info(
+                # Per-genome detail goes to the log file at DEBUG; the console only
+                # gets a progress line every PROGRESS_LOG_INTERVAL completions so
+                # synchronous stdout logging does not serialize the worker threads
+                logger.debug(
                     f"[{completed_count}/{total_count}] {task[ 'genus_species' ]}: "
                     f"scaffolds={entry[ 'scaffold_count' ]}, "
                     f"scaffold_N50={entry[ 'scaffold_n50' ]:,}, "
@@ -587,6 +603,9 @@ Notes:
                     f"GC={entry[ 'gc_content_percent' ]}%"
                 )
 
+                if completed_count % PROGRESS_LOG_INTERVAL == 0 or completed_count == total_count:
+                    logger.info( f"[{completed_count}/{total_count}] genomes processed" )
+
             except Exception as error:
                 logger.error( f"CRITICAL ERROR processing {task[ 'genus_species' ]}: {error}" )
                 sys.exit( 1 )
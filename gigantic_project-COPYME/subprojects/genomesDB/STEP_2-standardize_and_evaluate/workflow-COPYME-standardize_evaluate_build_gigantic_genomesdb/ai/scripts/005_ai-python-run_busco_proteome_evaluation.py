@@ -12,6 +12,11 @@ via a simple manifest file.
 BUSCO evaluates how complete a proteome is by searching for conserved single-copy
 orthologs expected to be present in all members of a taxonomic group.
 
+BUSCO is run in batch mode: for each lineage the proteomes are split into
+--parallel batches, and each batch is a single BUSCO run over a directory of
+proteome symlinks. This loads each lineage database once per batch instead of
+once per species.
+
 Inputs:
     - Lineage manifest: Simple text file with one BUSCO lineage per line
       (e.g., metazoa_odb10, eukaryota_odb10)
@@ -37,12 +42,57 @@ Usage:
 import argparse
 import sys
 import os
+import json
 import subprocess
 import logging
+import mmap
 import re
+import shutil
+import threading
+import time
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Count lines in a BUSCO short summary, e.g.:
+#     898    Complete and single-copy BUSCOs (S)
+#     10     Complete and duplicated BUSCOs (D)
+#     22     Fragmented BUSCOs (F)
+#     24     Missing BUSCOs (M)
+#     954    Total BUSCO groups searched
+# (bytes pattern, matched against the memory-mapped file without decoding it)
+BUSCO_SUMMARY_PATTERN = re.compile(
+    rb'(?P<single>\d+)\s+Complete and single-copy BUSCOs \(S\)'
+    rb'.*?(?P<duplicated>\d+)\s+Complete and duplicated BUSCOs \(D\)'
+    rb'.*?(?P<fragmented>\d+)\s+Fragmented BUSCOs \(F\)'
+    rb'.*?(?P<missing>\d+)\s+Missing BUSCOs \(M\)'
+    rb'.*?(?P<total>\d+)\s+Total BUSCO groups searched',
+    re.DOTALL
+)
+
+# Placeholder values for the six count columns of a lineage with no BUSCO statistics
+NA_BUSCO_COUNT_FIELDS = ( 'NA', ) * 6
+
+# Summary TSV output buffering: 1 MiB file buffer, rows handed over in blocks
+SUMMARY_WRITE_BUFFER_SIZE = 1 << 20
+SUMMARY_ROWS_PER_WRITE = 1024
+
+
+# Cached 'busco --version' output, keyed by the busco executable's path and mtime
+BUSCO_VERSION_CACHE_PATH = Path.home() / '.cache' / 'gigantic' / 'busco_version.json'
+
+# A BUSCO batch is killed after 1 hour per proteome in the batch
+BUSCO_TIMEOUT_SECONDS_PER_PROTEOME = 3600
+
+# One BUSCO batch-mode run: the proteomes in the batch ( list of ( proteome_path, phyloname ) ),
+# their total size in bytes, the lineage, and the batch staging directory
+BuscoBatchJob = namedtuple( 'BuscoBatchJob', [ 'batch_proteomes', 'batch_size', 'lineage', 'batch_directory' ] )
 
 
 # ============================================================================
@@ -128,6 +178,7 @@ def load_lineage_manifest( manifest_path: Path, logger: logging.Logger ) -> list
 # PHYLONAME EXTRACTION
 # ============================================================================
 
+@lru_cache( maxsize = None )
 def extract_phyloname_from_proteome_filename( filename: str ) -> str:
     """
     Extract phyloname from a standardized proteome filename.
@@ -136,6 +187,8 @@ def extract_phyloname_from_proteome_filename( filename: str ) -> str:
     Phylonames use underscores exclusively, so splitting on '-' and taking
     index 0 cleanly separates the phyloname from the -T1-proteome.aa suffix.
 
+    Results are memoized, so repeated lookups for the same file are free.
+
     Args:
         filename: The proteome filename (e.g., Metazoa_..._Homo_sapiens-T1-proteome.aa)
 
@@ -149,6 +202,70 @@ def extract_phyloname_from_proteome_filename( filename: str ) -> str:
     return phyloname
 
 
+# ============================================================================
+# BUSCO VERSION CHECK
+# ============================================================================
+
+def get_busco_version( logger: logging.Logger ) -> str:
+    """
+    Confirm BUSCO is installed and return its version string.
+
+    Running 'busco --version' starts a full Python interpreter, which can take
+    several seconds on shared filesystems. The version is therefore cached in
+    BUSCO_VERSION_CACHE_PATH keyed by the busco executable's path and
+    modification time, and the subprocess only runs when that key changes
+    (new install, different environment) or the cache is missing.
+
+    Args:
+        logger: Logger instance
+
+    Returns:
+        BUSCO version string (e.g., "BUSCO 5.8.0")
+
+    Raises:
+        SystemExit if BUSCO is not found or not working
+    """
+
+    busco_executable = shutil.which( 'busco' )
+
+    if busco_executable is None:
+        logger.error( "CRITICAL ERROR: BUSCO command not found!" )
+        logger.error( "Install BUSCO: mamba install busco" )
+        sys.exit( 1 )
+
+    cache_key = f"{busco_executable}:{os.path.getmtime( busco_executable )}"
+
+    try:
+        cached_version = json.loads( BUSCO_VERSION_CACHE_PATH.read_text() )
+        if cached_version.get( 'key' ) == cache_key:
+            return cached_version[ 'version' ]
+    except ( OSError, ValueError, KeyError ):
+        pass
+
+    busco_version = subprocess.run(
+        [ busco_executable, '--version' ],
+        capture_output = True,
+        text = True
+    )
+
+    if busco_version.returncode != 0:
+        logger.error( "CRITICAL ERROR: BUSCO not found or not working!" )
+        logger.error( "Install BUSCO: mamba install busco" )
+        logger.error( "Activate environment: conda activate ai_gigantic_genomesdb" )
+        sys.exit( 1 )
+
+    version = busco_version.stdout.strip()
+
+    # The cache is only an optimization; an unwritable home directory is not an error
+    try:
+        BUSCO_VERSION_CACHE_PATH.parent.mkdir( parents = True, exist_ok = True )
+        BUSCO_VERSION_CACHE_PATH.write_text( json.dumps( { 'key': cache_key, 'version': version } ) )
+    except OSError:
+        logger.debug( f"Could not write BUSCO version cache: {BUSCO_VERSION_CACHE_PATH}" )
+
+    return version
+
+
 # ============================================================================
 # BUSCO DATABASE MANAGEMENT
 # ============================================================================
@@ -161,6 +278,10 @@ def download_busco_databases( lineages: list, download_path: Path, logger: loggi
     parallel BUSCO jobs all trying to download simultaneously. Once
     downloaded, BUSCO runs use --offline to prevent re-download attempts.
 
+    Lineages already present in download_path (BUSCO keeps them under
+    lineages/<lineage>/ with a dataset.cfg) are reused rather than downloaded
+    again, so a shared --busco-download-path acts as a cache across runs.
+
     Args:
         lineages: List of BUSCO lineage names to download
         download_path: Directory to store downloaded databases
@@ -174,6 +295,12 @@ def download_busco_databases( lineages: list, download_path: Path, logger: loggi
     logger.info( "" )
 
     for lineage in lineages:
+        cached_dataset_config_path = download_path / 'lineages' / lineage / 'dataset.cfg'
+
+        if cached_dataset_config_path.exists():
+            logger.info( f"  {lineage}: Already downloaded, using cached copy" )
+            continue
+
         logger.info( f"Downloading {lineage}..." )
 
         download_command = [
@@ -209,7 +336,7 @@ def download_busco_databases( lineages: list, download_path: Path, logger: loggi
             sys.exit( 1 )
 
     logger.info( "" )
-    logger.info( "All BUSCO databases downloaded successfully" )
+    logger.info( "All BUSCO databases available" )
     logger.info( "" )
 
 
@@ -222,8 +349,6 @@ def cleanup_busco_databases( download_path: Path, logger: logging.Logger ) -> No
         logger: Logger instance
     """
 
-    import shutil
-
     if download_path.exists():
         logger.info( f"Cleaning up BUSCO databases: {download_path}" )
         shutil.rmtree( download_path )
@@ -236,60 +361,50 @@ def cleanup_busco_databases( download_path: Path, logger: logging.Logger ) -> No
 # BUSCO EXECUTION
 # ============================================================================
 
-def run_busco_single(
-    proteome_path: Path,
-    phyloname: str,
-    lineage: str,
-    output_base_dir: Path,
-    cpus_per_job: int,
-    busco_download_path: Path,
-    logger_name: str
-) -> dict:
+def find_busco_short_summary( run_directory: Path ) -> str:
     """
-    Run BUSCO on a single proteome for a single lineage.
+    Find the BUSCO short summary file in a BUSCO run directory.
 
-    Uses --offline and --download_path to point to pre-downloaded databases,
-    preventing each parallel job from attempting its own download.
+    The filename includes the lineage and input names
+    (short_summary.specific.<lineage>.<input>.txt), so it is matched by prefix.
+    os.scandir is used so no Path object or fnmatch call is made per entry.
 
     Args:
-        proteome_path: Path to the proteome FASTA file
-        phyloname: The phyloname for this species
-        lineage: BUSCO lineage database name
-        output_base_dir: Base output directory for BUSCO results
-        cpus_per_job: Number of CPUs to use for this BUSCO job
-        busco_download_path: Path to pre-downloaded BUSCO databases
-        logger_name: Name for subprocess logger
+        run_directory: BUSCO output directory for one proteome and lineage
 
     Returns:
-        Dictionary with BUSCO results summary
+        Filename of the short summary, or None if the directory or file does not exist
     """
 
-    # Create output directory structure: phyloname/lineage/
-    species_output_dir = output_base_dir / 'busco_results' / phyloname / lineage
-    species_output_dir.mkdir( parents = True, exist_ok = True )
+    try:
+        with os.scandir( run_directory ) as directory_entries:
+            for entry in directory_entries:
+                if entry.name.startswith( 'short_summary' ) and entry.name.endswith( '.txt' ):
+                    return entry.name
+    except FileNotFoundError:
+        return None
 
-    # BUSCO run name (used for output subdirectory)
-    run_name = f"busco_{lineage}"
+    return None
 
-    busco_command = [
-        'busco',
-        '-m', 'protein',
-        '-l', lineage,
-        '-i', str( proteome_path ),
-        '-o', run_name,
-        '--out_path', str( species_output_dir ),
-        '-c', str( cpus_per_job ),
-        '--download_path', str( busco_download_path ),
-        '--offline',
-        '--force',
-        '--quiet'
-    ]
+
+def empty_busco_result( proteome_path: Path, phyloname: str, lineage: str ) -> dict:
+    """
+    Build a result dictionary for one (proteome, lineage) evaluation with no statistics yet.
+
+    Args:
+        proteome_path: Path to the proteome FASTA file
+        phyloname: The phyloname for this species
+        lineage: BUSCO lineage database name
+
+    Returns:
+        Dictionary with BUSCO result fields set to their failure defaults
+    """
 
     result = {
         'phyloname': phyloname,
         'lineage': lineage,
         'proteome_path': str( proteome_path ),
-        'output_dir': str( species_output_dir / run_name ),
+        'output_dir': '',
         'success': False,
         'complete_single': 0,
         'complete_duplicated': 0,
@@ -300,39 +415,191 @@ def run_busco_single(
         'error_message': None
     }
 
-    try:
-        # Run BUSCO
-        process = subprocess.run(
+    return result
+
+
+def load_completed_busco_result( proteome_path: Path, phyloname: str, lineage: str, output_base_dir: Path ) -> dict:
+    """
+    Load the result of a (proteome, lineage) evaluation that already finished.
+
+    A BUSCO run counts as finished when its short summary exists in
+    busco_results/phyloname/lineage/busco_lineage/. This lets an interrupted run
+    be restarted without repeating the evaluations it already completed.
+
+    Args:
+        proteome_path: Path to the proteome FASTA file
+        phyloname: The phyloname for this species
+        lineage: BUSCO lineage database name
+        output_base_dir: Base output directory for BUSCO results
+
+    Returns:
+        Result dictionary parsed from the existing summary, or None if there is none
+    """
+
+    species_run_directory = output_base_dir / 'busco_results' / phyloname / lineage / f"busco_{lineage}"
+    summary_filename = find_busco_short_summary( species_run_directory )
+
+    if summary_filename is None:
+        return None
+
+    result = empty_busco_result( proteome_path, phyloname, lineage )
+    result.update( parse_busco_summary( species_run_directory / summary_filename ) )
+    result[ 'output_dir' ] = str( species_run_directory )
+    result[ 'success' ] = True
+
+    return result
+
+
+def start_busco_batch(
+    job: BuscoBatchJob,
+    cpus_per_job: int,
+    busco_download_path: Path,
+    force: bool
+) -> subprocess.Popen:
+    """
+    Stage one batch and start BUSCO on it in batch mode, without waiting for it.
+
+    Each proteome is symlinked into a per-batch input directory and BUSCO is given
+    that directory as its input, so the lineage database is loaded and the HMMER
+    workers are started once per batch rather than once per species. BUSCO is
+    started directly as a child of this process (no Python worker in between);
+    main() waits on it with os.wait() and then calls collect_busco_batch_results().
+
+    Uses --offline and --download_path to point to pre-downloaded databases,
+    preventing each parallel batch from attempting its own download.
+
+    Args:
+        job: BuscoBatchJob built in main()
+        cpus_per_job: Number of CPUs to use for this BUSCO batch
+        busco_download_path: Path to pre-downloaded BUSCO databases
+        force: Pass --force to BUSCO (set when the user asked to rerun completed evaluations)
+
+    Returns:
+        The running BUSCO process
+    """
+
+    batch_directory = job.batch_directory
+
+    # Stage the batch input directory with symlinks to the proteomes
+    if batch_directory.exists():
+        shutil.rmtree( batch_directory )
+
+    batch_input_directory = batch_directory / 'input'
+    batch_input_directory.mkdir( parents = True )
+
+    for proteome_path, phyloname in job.batch_proteomes:
+        os.symlink( proteome_path, batch_input_directory / proteome_path.name )
+
+    busco_command = [
+        'busco',
+        '-m', 'protein',
+        '-l', job.lineage,
+        '-i', str( batch_input_directory ),
+        '-o', f"busco_{job.lineage}",
+        '--out_path', str( batch_directory ),
+        '-c', str( cpus_per_job ),
+        '--download_path', str( busco_download_path ),
+        '--offline',
+        '--quiet'
+    ]
+
+    if force:
+        busco_command.append( '--force' )
+
+    # BUSCO output goes straight to files so Python never drains or decodes it
+    # (the child keeps its own copies of the descriptors once started)
+    with open( batch_directory / 'busco_stdout.log', 'wb' ) as output_stdout, open( batch_directory / 'busco_stderr.log', 'wb' ) as output_stderr:
+        process = subprocess.Popen(
             busco_command,
-            capture_output = True,
-            text = True,
-            timeout = 3600  # 1 hour timeout per species
+            stdout = output_stdout,
+            stderr = output_stderr
         )
 
-        if process.returncode != 0:
-            result[ 'error_message' ] = process.stderr[:500] if process.stderr else "Unknown error"
-            return result
+    return process
 
-        # Parse BUSCO short summary
-        short_summary_path = species_output_dir / run_name / 'short_summary.specific.*.txt'
 
-        # Find the actual summary file (filename includes lineage name)
-        summary_files = list( ( species_output_dir / run_name ).glob( 'short_summary*.txt' ) )
+def read_busco_batch_error( job: BuscoBatchJob ) -> str:
+    """
+    Read the error message of a BUSCO batch that exited with a non-zero status.
 
-        if summary_files:
-            summary_path = summary_files[ 0 ]
-            busco_stats = parse_busco_summary( summary_path )
-            result.update( busco_stats )
-            result[ 'success' ] = True
-        else:
-            result[ 'error_message' ] = "BUSCO summary file not found"
+    Args:
+        job: BuscoBatchJob whose BUSCO run failed
 
-    except subprocess.TimeoutExpired:
-        result[ 'error_message' ] = "BUSCO timed out (>1 hour)"
-    except Exception as exception:
-        result[ 'error_message' ] = str( exception )
+    Returns:
+        The last 500 bytes of the batch's BUSCO stderr, or "Unknown error" if it is empty
+    """
 
-    return result
+    stderr_log_path = job.batch_directory / 'busco_stderr.log'
+
+    try:
+        # Only the tail of stderr is kept for the summary table
+        with open( stderr_log_path, 'rb' ) as input_stderr:
+            input_stderr.seek( max( 0, os.fstat( input_stderr.fileno() ).st_size - 500 ) )
+            stderr_tail = input_stderr.read().decode( 'utf-8', errors = 'replace' )
+    except FileNotFoundError:
+        stderr_tail = ''
+
+    return stderr_tail if stderr_tail else "Unknown error"
+
+
+def collect_busco_batch_results( job: BuscoBatchJob, batch_error_message: str, output_base_dir: Path ) -> list:
+    """
+    Collect the per-species results of a finished BUSCO batch.
+
+    Each species' BUSCO output is moved to busco_results/phyloname/lineage/ so the
+    per-species layout is the same as a single-proteome run, and the batch
+    staging directory is removed.
+
+    Args:
+        job: BuscoBatchJob that has finished (or could not be started)
+        batch_error_message: Why the batch failed, or None if BUSCO exited cleanly
+        output_base_dir: Base output directory for BUSCO results
+
+    Returns:
+        List of result dictionaries, one per proteome in the batch
+    """
+
+    # BUSCO run name (used for output subdirectory)
+    run_name = f"busco_{job.lineage}"
+
+    results = [
+        empty_busco_result( proteome_path, phyloname, job.lineage )
+        for proteome_path, phyloname in job.batch_proteomes
+    ]
+
+    # Batch mode writes one subdirectory per input file under the run directory.
+    # A failed batch can still have completed some species, so check each one.
+    batch_run_directory = job.batch_directory / run_name
+
+    for ( proteome_path, phyloname ), result in zip( job.batch_proteomes, results ):
+        species_batch_output_dir = batch_run_directory / proteome_path.name
+
+        summary_filename = find_busco_short_summary( species_batch_output_dir )
+
+        if summary_filename is None:
+            result[ 'error_message' ] = batch_error_message if batch_error_message else "BUSCO summary file not found"
+            continue
+
+        # Move into the per-species layout: busco_results/phyloname/lineage/busco_lineage/
+        species_output_dir = output_base_dir / 'busco_results' / phyloname / job.lineage
+        species_output_dir.mkdir( parents = True, exist_ok = True )
+        species_run_directory = species_output_dir / run_name
+
+        if species_run_directory.exists():
+            shutil.rmtree( species_run_directory )
+
+        shutil.move( str( species_batch_output_dir ), str( species_run_directory ) )
+
+        summary_path = species_run_directory / summary_filename
+        busco_stats = parse_busco_summary( summary_path )
+        result.update( busco_stats )
+        result[ 'output_dir' ] = str( species_run_directory )
+        result[ 'success' ] = True
+
+    # Remove the staging directory (symlinks, batch-level BUSCO logs, leftovers)
+    shutil.rmtree( job.batch_directory, ignore_errors = True )
+
+    return results
 
 
 def parse_busco_summary( summary_path: Path ) -> dict:
@@ -343,7 +610,8 @@ def parse_busco_summary( summary_path: Path ) -> dict:
         summary_path: Path to BUSCO short_summary.txt file
 
     Returns:
-        Dictionary with BUSCO statistics
+        Dictionary with BUSCO statistics, plus 'summary_table_fields': the six
+        count columns already converted to strings for write_summary_table()
     """
 
     stats = {
@@ -355,41 +623,36 @@ def parse_busco_summary( summary_path: Path ) -> dict:
         'complete_percent': 0.0
     }
 
-    with open( summary_path, 'r' ) as input_summary:
-        content = input_summary.read()
-
-        # Parse the summary line like:
-        # C:95.2%[S:94.1%,D:1.1%],F:2.3%,M:2.5%,n:954
-
-        # Complete and single-copy (S)
-        match_single = re.search( r'(\d+)\s+Complete and single-copy BUSCOs \(S\)', content )
-        if match_single:
-            stats[ 'complete_single' ] = int( match_single.group( 1 ) )
-
-        # Complete and duplicated (D)
-        match_duplicated = re.search( r'(\d+)\s+Complete and duplicated BUSCOs \(D\)', content )
-        if match_duplicated:
-            stats[ 'complete_duplicated' ] = int( match_duplicated.group( 1 ) )
-
-        # Fragmented (F)
-        match_fragmented = re.search( r'(\d+)\s+Fragmented BUSCOs \(F\)', content )
-        if match_fragmented:
-            stats[ 'fragmented' ] = int( match_fragmented.group( 1 ) )
-
-        # Missing (M)
-        match_missing = re.search( r'(\d+)\s+Missing BUSCOs \(M\)', content )
-        if match_missing:
-            stats[ 'missing' ] = int( match_missing.group( 1 ) )
-
-        # Total (n)
-        match_total = re.search( r'(\d+)\s+Total BUSCO groups searched', content )
-        if match_total:
-            stats[ 'total' ] = int( match_total.group( 1 ) )
-
-        # Calculate complete percentage
-        if stats[ 'total' ] > 0:
-            complete = stats[ 'complete_single' ] + stats[ 'complete_duplicated' ]
-            stats[ 'complete_percent' ] = round( ( complete / stats[ 'total' ] ) * 100, 2 )
+    # Memory-map the summary and search the raw bytes: the search stops at the
+    # count lines near the top, and nothing but the matched digits is decoded
+    # (an empty file cannot be mapped and simply has no counts)
+    with open( summary_path, 'rb' ) as input_summary:
+        if os.fstat( input_summary.fileno() ).st_size > 0:
+            with mmap.mmap( input_summary.fileno(), 0, access = mmap.ACCESS_READ ) as summary_map:
+                # One pass picks up all five counts (S, D, F, M, n)
+                match_counts = BUSCO_SUMMARY_PATTERN.search( summary_map )
+
+                if match_counts:
+                    stats[ 'complete_single' ] = int( match_counts.group( 'single' ) )
+                    stats[ 'complete_duplicated' ] = int( match_counts.group( 'duplicated' ) )
+                    stats[ 'fragmented' ] = int( match_counts.group( 'fragmented' ) )
+                    stats[ 'missing' ] = int( match_counts.group( 'missing' ) )
+                    stats[ 'total' ] = int( match_counts.group( 'total' ) )
+
+    # Calculate complete percentage
+    if stats[ 'total' ] > 0:
+        complete = stats[ 'complete_single' ] + stats[ 'complete_duplicated' ]
+        stats[ 'complete_percent' ] = round( ( complete / stats[ 'total' ] ) * 100, 2 )
+
+    # Stringify once here so the summary writer only joins strings
+    stats[ 'summary_table_fields' ] = (
+        str( stats[ 'complete_percent' ] ),
+        str( stats[ 'complete_single' ] ),
+        str( stats[ 'complete_duplicated' ] ),
+        str( stats[ 'fragmented' ] ),
+        str( stats[ 'missing' ] ),
+        str( stats[ 'total' ] )
+    )
 
     return stats
 
@@ -398,32 +661,21 @@ def parse_busco_summary( summary_path: Path ) -> dict:
 # SUMMARY TABLE WRITING
 # ============================================================================
 
-def write_summary_table( summary_path: Path, results: list, lineages: list, logger: logging.Logger ) -> None:
+def write_summary_table( summary_path: Path, phylonames___lineages___results: dict, lineages: list, logger: logging.Logger ) -> None:
     """
     Write BUSCO results summary to a TSV file.
 
     Args:
         summary_path: Output path for summary TSV
-        results: List of result dictionaries from BUSCO runs
+        phylonames___lineages___results: Result dictionaries from BUSCO runs keyed by phyloname then lineage
+            (filled in directly as results arrive in main(), so no second copy is built here)
         lineages: List of lineage names used
         logger: Logger instance
     """
 
     logger.info( f"Writing BUSCO summary to: {summary_path}" )
 
-    # Organize results by phyloname
-    phylonames___results = {}
-
-    for result in results:
-        phyloname = result[ 'phyloname' ]
-        lineage = result[ 'lineage' ]
-
-        if phyloname not in phylonames___results:
-            phylonames___results[ phyloname ] = {}
-
-        phylonames___results[ phyloname ][ lineage ] = result
-
-    with open( summary_path, 'w' ) as output_summary:
+    with open( summary_path, 'w', buffering = SUMMARY_WRITE_BUFFER_SIZE ) as output_summary:
         # Build header with columns for each lineage
         header_parts = [ 'Phyloname (GIGANTIC phyloname for this species)' ]
 
@@ -439,33 +691,37 @@ def write_summary_table( summary_path: Path, results: list, lineages: list, logg
         output = '\t'.join( header_parts ) + '\n'
         output_summary.write( output )
 
-        # Write data rows
-        for phyloname in sorted( phylonames___results.keys() ):
+        # Write data rows in blocks of SUMMARY_ROWS_PER_WRITE lines
+        output_lines = []
+
+        for phyloname in sorted( phylonames___lineages___results.keys() ):
+            lineages___results = phylonames___lineages___results[ phyloname ]
             row_parts = [ phyloname ]
 
             for lineage in lineages:
-                if lineage in phylonames___results[ phyloname ]:
-                    result = phylonames___results[ phyloname ][ lineage ]
+                if lineage in lineages___results:
+                    result = lineages___results[ lineage ]
 
                     if result[ 'success' ]:
-                        row_parts.append( str( result[ 'complete_percent' ] ) )
-                        row_parts.append( str( result[ 'complete_single' ] ) )
-                        row_parts.append( str( result[ 'complete_duplicated' ] ) )
-                        row_parts.append( str( result[ 'fragmented' ] ) )
-                        row_parts.append( str( result[ 'missing' ] ) )
-                        row_parts.append( str( result[ 'total' ] ) )
+                        row_parts.extend( result[ 'summary_table_fields' ] )
                         row_parts.append( 'SUCCESS' )
                     else:
-                        row_parts.extend( [ 'NA', 'NA', 'NA', 'NA', 'NA', 'NA' ] )
+                        row_parts.extend( NA_BUSCO_COUNT_FIELDS )
                         sanitized_error = result[ 'error_message' ].replace( '\n', ' | ' ).replace( '\t', ' ' ).replace( '\r', '' ) if result[ 'error_message' ] else 'Unknown error'
                         row_parts.append( f"ERROR: {sanitized_error[:300]}" )
                 else:
-                    row_parts.extend( [ 'NA', 'NA', 'NA', 'NA', 'NA', 'NA', 'NOT_RUN' ] )
+                    row_parts.extend( NA_BUSCO_COUNT_FIELDS )
+                    row_parts.append( 'NOT_RUN' )
+
+            output_lines.append( '\t'.join( row_parts ) + '\n' )
+
+            if len( output_lines ) >= SUMMARY_ROWS_PER_WRITE:
+                output_summary.writelines( output_lines )
+                output_lines.clear()
 
-            output = '\t'.join( row_parts ) + '\n'
-            output_summary.write( output )
+        output_summary.writelines( output_lines )
 
-    logger.info( f"Summary written with {len( phylonames___results )} species" )
+    logger.info( f"Summary written with {len( phylonames___lineages___results )} species" )
 
 
 # ============================================================================
@@ -522,21 +778,28 @@ Lineage manifest format (one lineage per line):
         '--parallel',
         type = int,
         default = 4,
-        help = 'Number of parallel BUSCO jobs (default: 4)'
+        help = 'Number of parallel BUSCO batch jobs; proteomes are split into this many batches per lineage (default: 4)'
     )
 
     parser.add_argument(
         '--cpus-per-job',
         type = int,
         default = 1,
-        help = 'Number of CPUs per BUSCO job (default: 1)'
+        help = 'Number of CPUs per BUSCO batch job (default: 1)'
     )
 
     parser.add_argument(
         '--busco-download-path',
         type = str,
         default = None,
-        help = 'Directory for BUSCO database downloads. Defaults to OUTPUT_DIR/busco_databases/'
+        help = 'Directory for BUSCO database downloads; lineages already present here are reused. Defaults to OUTPUT_DIR/busco_databases/'
+    )
+
+    parser.add_argument(
+        '--force',
+        action = 'store_true',
+        default = False,
+        help = 'Rerun BUSCO evaluations that already have results in the output directory (default: reuse them)'
     )
 
     parser.add_argument(
@@ -594,23 +857,8 @@ Lineage manifest format (one lineage per line):
 
     logger.info( "Checking BUSCO availability..." )
 
-    try:
-        busco_version = subprocess.run(
-            [ 'busco', '--version' ],
-            capture_output = True,
-            text = True
-        )
-        if busco_version.returncode == 0:
-            logger.info( f"BUSCO version: {busco_version.stdout.strip()}" )
-        else:
-            logger.error( "CRITICAL ERROR: BUSCO not found or not working!" )
-            logger.error( "Install BUSCO: mamba install busco" )
-            logger.error( "Activate environment: conda activate ai_gigantic_genomesdb" )
-            sys.exit( 1 )
-    except FileNotFoundError:
-        logger.error( "CRITICAL ERROR: BUSCO command not found!" )
-        logger.error( "Install BUSCO: mamba install busco" )
-        sys.exit( 1 )
+    busco_version = get_busco_version( logger )
+    logger.info( f"BUSCO version: {busco_version}" )
 
     logger.info( "" )
 
@@ -623,7 +871,12 @@ Lineage manifest format (one lineage per line):
         logger.error( "Run Script 001 first to generate standardized proteomes." )
         sys.exit( 1 )
 
-    proteome_files = sorted( input_proteomes_directory.glob( '*.aa' ) )
+    # os.scandir avoids building a Path object (and running fnmatch) for every entry
+    with os.scandir( input_proteomes_directory ) as directory_entries:
+        proteome_files = sorted(
+            Path( entry.path ) for entry in directory_entries
+            if entry.name.endswith( '.aa' )
+        )
 
     if not proteome_files:
         logger.error( f"CRITICAL ERROR: No .aa files found in: {input_proteomes_directory}" )
@@ -657,79 +910,190 @@ Lineage manifest format (one lineage per line):
     logger.info( "=" * 80 )
     logger.info( "RUNNING BUSCO EVALUATIONS" )
     logger.info( "=" * 80 )
-    logger.info( f"Total jobs: {len( proteome_files )} proteomes x {len( lineages )} lineages = {len( proteome_files ) * len( lineages )}" )
+    logger.info( f"Total evaluations: {len( proteome_files )} proteomes x {len( lineages )} lineages = {len( proteome_files ) * len( lineages )}" )
     logger.info( "" )
 
-    all_results = []
-    total_jobs = len( proteome_files ) * len( lineages )
+    # Results are stored straight into the phyloname -> lineage layout the summary
+    # table is written from, so no flat list of results is kept alongside it
+    phylonames___lineages___results = {}
+    successful_runs = 0
+    failed_runs = 0
+    total_evaluations = len( proteome_files ) * len( lineages )
 
-    # Build list of all jobs to run
+    proteomes_and_phylonames = [
+        ( proteome_file, extract_phyloname_from_proteome_filename( proteome_file.name ) )
+        for proteome_file in proteome_files
+    ]
+
+    # Reuse (proteome, lineage) evaluations that already have a short summary from
+    # an earlier, possibly interrupted, run unless --force was given
+    lineages___pending_proteomes = {}
+    skipped_evaluations = 0
+
+    for lineage in lineages:
+        pending_proteomes = []
+
+        for proteome_file, phyloname in proteomes_and_phylonames:
+            completed_result = None
+            if not arguments.force:
+                completed_result = load_completed_busco_result( proteome_file, phyloname, lineage, output_base_directory.resolve() )
+
+            if completed_result is None:
+                pending_proteomes.append( ( proteome_file, phyloname ) )
+                continue
+
+            skipped_evaluations += 1
+            successful_runs += 1
+            if phyloname not in phylonames___lineages___results:
+                phylonames___lineages___results[ phyloname ] = {}
+            phylonames___lineages___results[ phyloname ][ lineage ] = completed_result
+
+        lineages___pending_proteomes[ lineage ] = pending_proteomes
+
+    if skipped_evaluations > 0:
+        logger.info( f"Reusing {skipped_evaluations} completed BUSCO evaluations from a previous run (use --force to rerun them)" )
+        logger.info( "" )
+
+    # Group proteomes into batches per ( lineage, parallel slot ). Each batch is one
+    # BUSCO batch-mode run, so the lineage database is loaded once per batch instead
+    # of once per species while still keeping --parallel BUSCO processes busy.
+    #
+    # BUSCO runtime scales with proteome size, so proteomes are assigned largest
+    # first to the batch with the least total size so far, and batches are
+    # dispatched largest first (longest-processing-time-first scheduling). This
+    # keeps a single large batch from finishing long after the others.
+    batches_base_directory = ( output_base_directory / 'busco_batches' ).resolve()
+
+    # One stat() per proteome, shared by all lineages
+    proteome_paths___sizes = {
+        proteome_file: proteome_file.stat().st_size
+        for proteome_file in proteome_files
+    }
+
+    # Build list of all batch jobs to run
     jobs_to_run = []
-    for proteome_file in proteome_files:
-        phyloname = extract_phyloname_from_proteome_filename( proteome_file.name )
-        for lineage in lineages:
-            jobs_to_run.append( {
-                'proteome_path': proteome_file,
-                'phyloname': phyloname,
-                'lineage': lineage,
-                'output_base_dir': output_base_directory,
-                'cpus_per_job': arguments.cpus_per_job,
-                'busco_download_path': busco_download_path,
-                'logger_name': 'busco_subprocess'
-            } )
-
-    # Run jobs in parallel using ProcessPoolExecutor
-    logger.info( f"Starting parallel execution with {arguments.parallel} workers..." )
+    for lineage in lineages:
+        pending_proteomes = sorted(
+            lineages___pending_proteomes[ lineage ],
+            key = lambda proteome_and_phyloname: proteome_paths___sizes[ proteome_and_phyloname[ 0 ] ],
+            reverse = True
+        )
+        batch_count = min( arguments.parallel, len( pending_proteomes ) )
+
+        batches_proteomes = [ [] for batch_index in range( batch_count ) ]
+        batches_sizes = [ 0 ] * batch_count
+
+        for proteome_file, phyloname in pending_proteomes:
+            smallest_batch_index = batches_sizes.index( min( batches_sizes ) )
+            batches_proteomes[ smallest_batch_index ].append( ( proteome_file, phyloname ) )
+            batches_sizes[ smallest_batch_index ] += proteome_paths___sizes[ proteome_file ]
+
+        for batch_index in range( batch_count ):
+            jobs_to_run.append( BuscoBatchJob(
+                batch_proteomes = batches_proteomes[ batch_index ],
+                batch_size = batches_sizes[ batch_index ],
+                lineage = lineage,
+                batch_directory = batches_base_directory / lineage / f"batch_{batch_index + 1}"
+            ) )
+
+    jobs_to_run.sort( key = lambda job: job.batch_size, reverse = True )
+
+    # Arguments that are the same for every batch are kept once, not per job
+    busco_settings = {
+        'cpus_per_job': arguments.cpus_per_job,
+        'busco_download_path': busco_download_path,
+        'force': arguments.force
+    }
+    resolved_output_base_directory = output_base_directory.resolve()
+
+    total_jobs = len( jobs_to_run )
+
+    # Run batches in parallel: BUSCO processes are started directly with Popen and
+    # reaped with os.wait(), so the only processes running are the --parallel
+    # BUSCO batches themselves (no Python worker process per batch)
+    logger.info( f"Starting parallel execution of {total_jobs} BUSCO batches, {arguments.parallel} at a time..." )
     logger.info( "" )
 
     jobs_completed = 0
+    evaluations_completed = skipped_evaluations
 
-    with ProcessPoolExecutor( max_workers = arguments.parallel ) as executor:
-        # Submit all jobs
-        future_to_job = {}
-        for job in jobs_to_run:
-            future = executor.submit(
-                run_busco_single,
-                proteome_path = job[ 'proteome_path' ],
-                phyloname = job[ 'phyloname' ],
-                lineage = job[ 'lineage' ],
-                output_base_dir = job[ 'output_base_dir' ],
-                cpus_per_job = job[ 'cpus_per_job' ],
-                busco_download_path = job[ 'busco_download_path' ],
-                logger_name = job[ 'logger_name' ]
-            )
-            future_to_job[ future ] = job
+    jobs_iterator = iter( jobs_to_run )
 
-        # Collect results as they complete
-        for future in as_completed( future_to_job ):
-            jobs_completed += 1
-            job = future_to_job[ future ]
+    # pid -> ( process, job, timeout timer, start time ) for every running batch
+    pids___running_batches = {}
+
+    while True:
+        # ( job, batch_error_message ) for batches that finished in this round
+        finished_batches = []
+
+        # Top the running set back up to --parallel batches
+        while len( pids___running_batches ) < arguments.parallel:
+            job = next( jobs_iterator, None )
+            if job is None:
+                break
 
             try:
-                result = future.result()
-                all_results.append( result )
+                process = start_busco_batch( job, **busco_settings )
+            except Exception as exception:
+                logger.error( f"Batch ({job.lineage}, {len( job.batch_proteomes )} proteomes): EXCEPTION - {str( exception )}" )
+                finished_batches.append( ( job, str( exception ) ) )
+                continue
+
+            # 1 hour timeout per species in the batch
+            timeout_timer = threading.Timer( BUSCO_TIMEOUT_SECONDS_PER_PROTEOME * len( job.batch_proteomes ), process.kill )
+            timeout_timer.daemon = True
+            timeout_timer.start()
+
+            pids___running_batches[ process.pid ] = ( process, job, timeout_timer, time.monotonic() )
+
+        if not finished_batches:
+            if not pids___running_batches:
+                break
+
+            # Block until any BUSCO batch exits
+            pid, wait_status = os.wait()
+
+            if pid not in pids___running_batches:
+                continue
+
+            process, job, timeout_timer, start_time = pids___running_batches.pop( pid )
+            timeout_timer.cancel()
+
+            # Hand the exit status to the Popen object so it does not try to reap the pid again
+            process.returncode = os.waitstatus_to_exitcode( wait_status )
+
+            batch_error_message = None
+            if process.returncode != 0:
+                timeout_seconds = BUSCO_TIMEOUT_SECONDS_PER_PROTEOME * len( job.batch_proteomes )
+                if process.returncode < 0 and time.monotonic() - start_time >= timeout_seconds:
+                    batch_error_message = f"BUSCO batch timed out (>{len( job.batch_proteomes )} hours)"
+                else:
+                    batch_error_message = read_busco_batch_error( job )
+
+            finished_batches.append( ( job, batch_error_message ) )
+
+        for job, batch_error_message in finished_batches:
+            jobs_completed += 1
+            logger.debug( f"Batch {jobs_completed}/{total_jobs} ({job.lineage}, {len( job.batch_proteomes )} proteomes) finished" )
+
+            batch_results = collect_busco_batch_results( job, batch_error_message, resolved_output_base_directory )
+
+            for result in batch_results:
+                evaluations_completed += 1
+                phyloname = result[ 'phyloname' ]
+                if phyloname not in phylonames___lineages___results:
+                    phylonames___lineages___results[ phyloname ] = {}
+                phylonames___lineages___results[ phyloname ][ result[ 'lineage' ] ] = result
 
                 if result[ 'success' ]:
-                    logger.info( f"[{jobs_completed}/{total_jobs}] {result[ 'phyloname' ]} - {result[ 'lineage' ]}: Complete {result[ 'complete_percent' ]}% ({result[ 'complete_single' ]}S + {result[ 'complete_duplicated' ]}D)" )
+                    successful_runs += 1
+                    logger.info( f"[{evaluations_completed}/{total_evaluations}] {result[ 'phyloname' ]} - {result[ 'lineage' ]}: Complete {result[ 'complete_percent' ]}% ({result[ 'complete_single' ]}S + {result[ 'complete_duplicated' ]}D)" )
                 else:
-                    logger.warning( f"[{jobs_completed}/{total_jobs}] {result[ 'phyloname' ]} - {result[ 'lineage' ]}: FAILED - {result[ 'error_message' ]}" )
+                    failed_runs += 1
+                    logger.warning( f"[{evaluations_completed}/{total_evaluations}] {result[ 'phyloname' ]} - {result[ 'lineage' ]}: FAILED - {result[ 'error_message' ]}" )
 
-            except Exception as exception:
-                logger.error( f"[{jobs_completed}/{total_jobs}] {job[ 'phyloname' ]} - {job[ 'lineage' ]}: EXCEPTION - {str( exception )}" )
-                all_results.append( {
-                    'phyloname': job[ 'phyloname' ],
-                    'lineage': job[ 'lineage' ],
-                    'proteome_path': str( job[ 'proteome_path' ] ),
-                    'output_dir': '',
-                    'success': False,
-                    'complete_single': 0,
-                    'complete_duplicated': 0,
-                    'fragmented': 0,
-                    'missing': 0,
-                    'total': 0,
-                    'complete_percent': 0.0,
-                    'error_message': str( exception )
-                } )
+    # All batch staging directories are removed per batch; drop the empty parent
+    shutil.rmtree( batches_base_directory, ignore_errors = True )
 
     logger.info( "" )
 
@@ -742,7 +1106,7 @@ Lineage manifest format (one lineage per line):
     logger.info( "=" * 80 )
     logger.info( "" )
 
-    write_summary_table( output_summary_path, all_results, lineages, logger )
+    write_summary_table( output_summary_path, phylonames___lineages___results, lineages, logger )
     logger.info( "" )
 
     # ========================================================================
@@ -761,13 +1125,10 @@ Lineage manifest format (one lineage per line):
     # FINAL SUMMARY
     # ========================================================================
 
-    successful_runs = sum( 1 for r in all_results if r[ 'success' ] )
-    failed_runs = sum( 1 for r in all_results if not r[ 'success' ] )
-
     logger.info( "=" * 80 )
     logger.info( "SUMMARY" )
     logger.info( "=" * 80 )
-    logger.info( f"Total BUSCO runs: {len( all_results )}" )
+    logger.info( f"Total BUSCO runs: {successful_runs + failed_runs}" )
     logger.info( f"Successful: {successful_runs}" )
     logger.info( f"Failed: {failed_runs}" )
     logger.info( "" )
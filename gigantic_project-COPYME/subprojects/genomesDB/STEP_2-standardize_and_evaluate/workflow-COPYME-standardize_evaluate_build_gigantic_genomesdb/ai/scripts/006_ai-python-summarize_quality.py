@@ -28,10 +28,21 @@ Usage:
 """
 
 import argparse
+import csv
+import io
 import sys
 import logging
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Stand-in assembly statistics for species without a genome (shared, only ever read via .get)
+NO_ASSEMBLY_STATS = {}
 
 
 # ============================================================================
@@ -88,10 +99,11 @@ def load_assembly_stats( stats_path: Path, logger: logging.Logger ) -> dict:
 
     phylonames___stats = {}
 
-    with open( stats_path, 'r' ) as input_stats:
+    with open( stats_path, 'r', newline = '' ) as input_stats:
+        csv_reader = csv.reader( input_stats, delimiter = '\t', quoting = csv.QUOTE_NONE )
+
         # Read header to get column names
-        header_line = input_stats.readline().strip()
-        header_parts = header_line.split( '\t' )
+        header_parts = next( csv_reader, [] )
 
         # Find column indices for key metrics
         # Column names have self-documenting format: Name (description)
@@ -101,23 +113,31 @@ def load_assembly_stats( stats_path: Path, logger: logging.Logger ) -> dict:
             column_name = header.split( ' (' )[ 0 ]
             column_indices[ column_name ] = index
 
-        for line in input_stats:
-            line = line.strip()
-            if not line:
+        # Resolve each key metric's column index once, before the row loop
+        # (None when the column is absent, which gives NA for every row)
+        stats_keys_and_column_indices = (
+            ( 'genus_species', column_indices.get( 'Genus_Species' ) ),
+            ( 'scaffold_count', column_indices.get( 'Scaffold_Count' ) ),
+            ( 'total_scaffold_length', column_indices.get( 'Total_Scaffold_Length_Basepairs' ) ),
+            ( 'scaffold_n50', column_indices.get( 'Scaffold_N50_Basepairs' ) ),
+            ( 'contig_n50', column_indices.get( 'Contig_N50_Basepairs' ) ),
+            ( 'gc_content', column_indices.get( 'GC_Content_Percent' ) )
+        )
+
+        for parts in csv_reader:
+            if not parts:
                 continue
 
-            parts = line.split( '\t' )
             phyloname = parts[ 0 ]
+            parts_count = len( parts )
 
             # Extract key metrics
-            stats = {
-                'genus_species': parts[ column_indices.get( 'Genus_Species', 1 ) ] if 'Genus_Species' in column_indices else 'NA',
-                'scaffold_count': parts[ column_indices.get( 'Scaffold_Count', 3 ) ] if 'Scaffold_Count' in column_indices else 'NA',
-                'total_scaffold_length': parts[ column_indices.get( 'Total_Scaffold_Length_Basepairs', 4 ) ] if 'Total_Scaffold_Length_Basepairs' in column_indices else 'NA',
-                'scaffold_n50': parts[ column_indices.get( 'Scaffold_N50_Basepairs', 5 ) ] if 'Scaffold_N50_Basepairs' in column_indices else 'NA',
-                'contig_n50': parts[ column_indices.get( 'Contig_N50_Basepairs', 13 ) ] if 'Contig_N50_Basepairs' in column_indices else 'NA',
-                'gc_content': parts[ column_indices.get( 'GC_Content_Percent', -1 ) ] if 'GC_Content_Percent' in column_indices else 'NA'
-            }
+            stats = {}
+            for stats_key, column_index in stats_keys_and_column_indices:
+                if column_index is not None and column_index < parts_count:
+                    stats[ stats_key ] = parts[ column_index ]
+                else:
+                    stats[ stats_key ] = 'NA'
 
             phylonames___stats[ phyloname ] = stats
 
@@ -148,10 +168,11 @@ def load_busco_summary( summary_path: Path, logger: logging.Logger ) -> tuple:
     phylonames___busco_stats = {}
     lineage_names = []
 
-    with open( summary_path, 'r' ) as input_summary:
+    with open( summary_path, 'r', newline = '' ) as input_summary:
+        csv_reader = csv.reader( input_summary, delimiter = '\t', quoting = csv.QUOTE_NONE )
+
         # Read header to identify lineages
-        header_line = input_summary.readline().strip()
-        header_parts = header_line.split( '\t' )
+        header_parts = next( csv_reader, [] )
 
         # Extract lineage names from column headers
         # Format: lineage_Complete_Percent (description)
@@ -163,27 +184,27 @@ def load_busco_summary( summary_path: Path, logger: logging.Logger ) -> tuple:
 
         logger.info( f"Found {len( lineage_names )} BUSCO lineage(s): {', '.join( lineage_names )}" )
 
-        # Build column index map for each lineage
-        lineage_column_indices = {}
+        # Resolve each lineage's Complete_Percent column index once, before the row loop
+        lineages_and_column_indices = []
         for lineage in lineage_names:
+            column_index = None
             for index, header in enumerate( header_parts ):
                 if header.startswith( f'{lineage}_Complete_Percent' ):
-                    lineage_column_indices[ lineage ] = index
+                    column_index = index
                     break
+            lineages_and_column_indices.append( ( lineage, column_index ) )
 
-        for line in input_summary:
-            line = line.strip()
-            if not line:
+        for parts in csv_reader:
+            if not parts:
                 continue
 
-            parts = line.split( '\t' )
             phyloname = parts[ 0 ]
+            parts_count = len( parts )
 
             busco_stats = {}
-            for lineage in lineage_names:
-                col_index = lineage_column_indices.get( lineage )
-                if col_index and col_index < len( parts ):
-                    busco_stats[ lineage ] = parts[ col_index ]
+            for lineage, column_index in lineages_and_column_indices:
+                if column_index and column_index < parts_count:
+                    busco_stats[ lineage ] = parts[ column_index ]
                 else:
                     busco_stats[ lineage ] = 'NA'
 
@@ -216,20 +237,42 @@ def load_proteome_manifest( manifest_path: Path, logger: logging.Logger ) -> dic
 
     phylonames___species_info = {}
 
-    with open( manifest_path, 'r' ) as input_manifest:
-        # Skip header
-        header_line = input_manifest.readline()
+    with open( manifest_path, 'r', newline = '' ) as input_manifest:
+        csv_reader = csv.reader( input_manifest, delimiter = '\t', quoting = csv.QUOTE_NONE )
+
+        # Read header and resolve the columns by name once
+        # Column names have self-documenting format: Name (description)
+        header_parts = next( csv_reader, [] )
+
+        column_indices = {}
+        for index, header in enumerate( header_parts ):
+            column_name = header.split( ' (' )[ 0 ]
+            column_indices[ column_name ] = index
 
         # Genus_Species	Phyloname	Phyloname_Taxonid	Source_Filename	Output_Filename	Sequence_Count
-        for line in input_manifest:
-            line = line.strip()
-            if not line:
+        for required_column_name in [ 'Genus_Species', 'Phyloname' ]:
+            if required_column_name not in column_indices:
+                logger.error( f"CRITICAL ERROR: Column '{required_column_name}' not found in proteome manifest header!" )
+                logger.error( f"File: {manifest_path}" )
+                logger.error( f"Header columns: {', '.join( column_indices.keys() )}" )
+                sys.exit( 1 )
+
+        genus_species_index = column_indices[ 'Genus_Species' ]
+        phyloname_index = column_indices[ 'Phyloname' ]
+        sequence_count_index = column_indices.get( 'Sequence_Count' )
+
+        for parts in csv_reader:
+            if not parts:
                 continue
 
-            parts = line.split( '\t' )
-            genus_species = parts[ 0 ]
-            phyloname = parts[ 1 ]
-            sequence_count = parts[ 5 ] if len( parts ) > 5 else 'NA'
+            parts_count = len( parts )
+            genus_species = parts[ genus_species_index ]
+            phyloname = parts[ phyloname_index ]
+
+            if sequence_count_index is not None and sequence_count_index < parts_count:
+                sequence_count = parts[ sequence_count_index ]
+            else:
+                sequence_count = 'NA'
 
             phylonames___species_info[ phyloname ] = {
                 'genus_species': genus_species,
@@ -247,6 +290,7 @@ def load_proteome_manifest( manifest_path: Path, logger: logging.Logger ) -> dic
 
 def write_comprehensive_summary(
     summary_path: Path,
+    sorted_phylonames: list,
     phylonames___species_info: dict,
     phylonames___assembly_stats: dict,
     phylonames___busco_stats: dict,
@@ -258,6 +302,7 @@ def write_comprehensive_summary(
 
     Args:
         summary_path: Output path for summary TSV
+        sorted_phylonames: Phylonames of all species, in the row order of the summary
         phylonames___species_info: Species info from proteome manifest
         phylonames___assembly_stats: Assembly statistics
         phylonames___busco_stats: BUSCO statistics
@@ -267,55 +312,68 @@ def write_comprehensive_summary(
 
     logger.info( f"Writing comprehensive quality summary to: {summary_path}" )
 
-    with open( summary_path, 'w' ) as output_summary:
-        # Build header
-        header_parts = [
-            'Phyloname (GIGANTIC phyloname for this species)',
-            'Genus_Species (binomial species name)',
-            'Proteome_Sequence_Count (number of protein sequences)',
-            'Has_Genome (whether genome assembly is available YES or NO)',
-            'Scaffold_Count (number of scaffolds in genome assembly)',
-            'Total_Assembly_Size_Bp (total base pairs in assembly)',
-            'Scaffold_N50_Bp (scaffold N50 in base pairs)',
-            'Contig_N50_Bp (contig N50 in base pairs)',
-            'GC_Content_Percent (GC percentage of assembly)'
+    # Build header
+    header_parts = [
+        'Phyloname (GIGANTIC phyloname for this species)',
+        'Genus_Species (binomial species name)',
+        'Proteome_Sequence_Count (number of protein sequences)',
+        'Has_Genome (whether genome assembly is available YES or NO)',
+        'Scaffold_Count (number of scaffolds in genome assembly)',
+        'Total_Assembly_Size_Bp (total base pairs in assembly)',
+        'Scaffold_N50_Bp (scaffold N50 in base pairs)',
+        'Contig_N50_Bp (contig N50 in base pairs)',
+        'GC_Content_Percent (GC percentage of assembly)'
+    ]
+
+    # Add BUSCO columns for each lineage
+    for lineage in lineage_names:
+        header_parts.append( f'BUSCO_{lineage}_Complete_Percent (percentage of complete BUSCOs for {lineage})' )
+
+    # The whole table is built in memory and written to the file in one call
+    # Rows are formatted by the C csv writer (same tab-separated, unquoted layout the loaders read)
+    output_buffer = io.StringIO()
+    csv_writer = csv.writer( output_buffer, delimiter = '\t', lineterminator = '\n', quoting = csv.QUOTE_NONE )
+
+    csv_writer.writerow( header_parts )
+
+    # Build data rows for all species
+    for phyloname in sorted_phylonames:
+        species_info = phylonames___species_info[ phyloname ]
+        busco_stats = phylonames___busco_stats.get( phyloname, {} )
+
+        # One lookup answers both "has a genome" and "which statistics"
+        assembly_stats = phylonames___assembly_stats.get( phyloname )
+        if assembly_stats is None:
+            has_genome = 'NO'
+            assembly_stats = NO_ASSEMBLY_STATS
+        else:
+            has_genome = 'YES'
+
+        # Bind each dict's .get once per row instead of resolving it for every column
+        get_species_value = species_info.get
+        get_assembly_value = assembly_stats.get
+        get_busco_value = busco_stats.get
+
+        row_parts = [
+            phyloname,
+            get_species_value( 'genus_species', 'NA' ),
+            get_species_value( 'sequence_count', 'NA' ),
+            has_genome,
+            get_assembly_value( 'scaffold_count', 'NA' ),
+            get_assembly_value( 'total_scaffold_length', 'NA' ),
+            get_assembly_value( 'scaffold_n50', 'NA' ),
+            get_assembly_value( 'contig_n50', 'NA' ),
+            get_assembly_value( 'gc_content', 'NA' )
         ]
 
-        # Add BUSCO columns for each lineage
-        for lineage in lineage_names:
-            header_parts.append( f'BUSCO_{lineage}_Complete_Percent (percentage of complete BUSCOs for {lineage})' )
-
-        output = '\t'.join( header_parts ) + '\n'
-        output_summary.write( output )
-
-        # Write data rows for all species
-        for phyloname in sorted( phylonames___species_info.keys() ):
-            species_info = phylonames___species_info[ phyloname ]
-            assembly_stats = phylonames___assembly_stats.get( phyloname, {} )
-            busco_stats = phylonames___busco_stats.get( phyloname, {} )
-
-            has_genome = 'YES' if phyloname in phylonames___assembly_stats else 'NO'
+        # Add BUSCO values (one extend per row rather than one append per lineage)
+        row_parts.extend( [ get_busco_value( lineage, 'NA' ) for lineage in lineage_names ] )
 
-            row_parts = [
-                phyloname,
-                species_info.get( 'genus_species', 'NA' ),
-                species_info.get( 'sequence_count', 'NA' ),
-                has_genome,
-                assembly_stats.get( 'scaffold_count', 'NA' ),
-                assembly_stats.get( 'total_scaffold_length', 'NA' ),
-                assembly_stats.get( 'scaffold_n50', 'NA' ),
-                assembly_stats.get( 'contig_n50', 'NA' ),
-                assembly_stats.get( 'gc_content', 'NA' )
-            ]
+        csv_writer.writerow( row_parts )
 
-            # Add BUSCO values
-            for lineage in lineage_names:
-                row_parts.append( busco_stats.get( lineage, 'NA' ) )
+    summary_path.write_text( output_buffer.getvalue() )
 
-            output = '\t'.join( row_parts ) + '\n'
-            output_summary.write( output )
-
-    logger.info( f"Summary written with {len( phylonames___species_info )} species" )
+    logger.info( f"Summary written with {len( sorted_phylonames )} species" )
 
 
 # ============================================================================
@@ -415,14 +473,21 @@ Examples:
     logger.info( "=" * 80 )
     logger.info( "" )
 
-    # Load proteome manifest (required - this defines all species)
-    phylonames___species_info = load_proteome_manifest( input_proteome_manifest_path, logger )
+    # The three inputs are independent files, so read them concurrently
+    with ThreadPoolExecutor( max_workers = 3 ) as executor:
+        # Load proteome manifest (required - this defines all species)
+        future_species_info = executor.submit( load_proteome_manifest, input_proteome_manifest_path, logger )
+
+        # Load assembly statistics (optional - not all species have genomes)
+        future_assembly_stats = executor.submit( load_assembly_stats, input_assembly_stats_path, logger )
 
-    # Load assembly statistics (optional - not all species have genomes)
-    phylonames___assembly_stats = load_assembly_stats( input_assembly_stats_path, logger )
+        # Load BUSCO summary (optional - may not have been run yet)
+        future_busco_stats = executor.submit( load_busco_summary, input_busco_summary_path, logger )
 
-    # Load BUSCO summary (optional - may not have been run yet)
-    phylonames___busco_stats, lineage_names = load_busco_summary( input_busco_summary_path, logger )
+        # result() re-raises any loader failure (including sys.exit) in the main thread
+        phylonames___species_info = future_species_info.result()
+        phylonames___assembly_stats = future_assembly_stats.result()
+        phylonames___busco_stats, lineage_names = future_busco_stats.result()
 
     logger.info( "" )
 
@@ -479,9 +544,13 @@ Examples:
     logger.info( "=" * 80 )
     logger.info( "" )
 
+    # Species are written in phyloname order; sort once here and hand the order down
+    sorted_phylonames = sorted( phylonames___species_info.keys() )
+
     # Write comprehensive quality summary
     write_comprehensive_summary(
         summary_path = output_summary_path,
+        sorted_phylonames = sorted_phylonames,
         phylonames___species_info = phylonames___species_info,
         phylonames___assembly_stats = phylonames___assembly_stats,
         phylonames___busco_stats = phylonames___busco_stats,
@@ -24,13 +24,24 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 import logging
 import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Bytes requested per os.copy_file_range call (the kernel may copy less per call)
+COPY_CHUNK_BYTES = 1 << 30
+
+# 1 MiB file buffers for the fallback copy and the commands log
+IO_BUFFER_BYTES = 1 << 20
 
 
 # ============================================================================
@@ -69,86 +80,67 @@ def setup_logging( log_file_path: Path ) -> logging.Logger:
 
 
 # ============================================================================
-# BUILD SINGLE BLAST DATABASE
+# FILE COPY
 # ============================================================================
 
-def build_single_blastdb(
-    proteome_path: Path,
-    blastdb_dir: Path,
-    logger_name: str
-) -> dict:
+def fast_copy( source_path: Path, dest_path: Path ) -> None:
     """
-    Build a BLAST database for a single proteome.
+    Copy a file like shutil.copy2, moving the bytes inside the kernel.
 
-    Args:
-        proteome_path: Path to the proteome FASTA file
-        blastdb_dir: Directory for BLAST database output
-        logger_name: Logger name for this process
+    os.copy_file_range copies without passing the data through Python and lets
+    copy-on-write filesystems reflink and NFS 4.2 copy server-side. Where it is
+    not available or not supported for these files, a buffered copy is used.
 
-    Returns:
-        Dictionary with build results
+    Args:
+        source_path: File to copy
+        dest_path: Destination file path
     """
 
-    logger = logging.getLogger( logger_name )
+    copy_file_range = getattr( os, 'copy_file_range', None )
+
+    with open( source_path, 'rb' ) as input_file, open( dest_path, 'wb' ) as output_file:
+        try:
+            if copy_file_range is None:
+                raise OSError( 'os.copy_file_range not available' )
+            while copy_file_range( input_file.fileno(), output_file.fileno(), COPY_CHUNK_BYTES ) > 0:
+                pass
+        except OSError:
+            # Start over with a plain buffered copy
+            input_file.seek( 0 )
+            output_file.seek( 0 )
+            output_file.truncate()
+            shutil.copyfileobj( input_file, output_file, IO_BUFFER_BYTES )
+
+    # Keep permissions and timestamps, as shutil.copy2 does
+    shutil.copystat( source_path, dest_path )
+
 
-    proteome_filename = proteome_path.name
+# ============================================================================
+# MAKEBLASTDB COMMAND
+# ============================================================================
 
-    # Copy FASTA to blastdb directory
-    dest_fasta = blastdb_dir / proteome_filename
+def build_makeblastdb_command( fasta_path: Path ) -> list:
+    """
+    Build the makeblastdb command for a single proteome staged in the database directory.
 
-    try:
-        shutil.copy2( proteome_path, dest_fasta )
-    except Exception as error:
-        return {
-            'proteome_filename': proteome_filename,
-            'success': False,
-            'error': f"Failed to copy FASTA: {error}"
-        }
+    Args:
+        fasta_path: Path to the proteome FASTA copied into the BLAST database directory
+
+    Returns:
+        makeblastdb argument list (the database is written next to the FASTA)
+    """
 
-    # Build BLAST database
     # Command: makeblastdb -in FASTA -dbtype prot -out FASTA
     # Note: We omit -parse_seqids because GIGANTIC sequence IDs exceed BLAST's
     # 50-character limit. BLAST searches still work correctly without this flag.
     makeblastdb_command = [
         'makeblastdb',
-        '-in', str( dest_fasta ),
+        '-in', str( fasta_path ),
         '-dbtype', 'prot',
-        '-out', str( dest_fasta )
+        '-out', str( fasta_path )
     ]
 
-    try:
-        # Suppress stderr to avoid thousands of "invalid residue" warnings
-        # (selenocysteine, pyrrolysine, etc.) which slow down execution
-        result = subprocess.run(
-            makeblastdb_command,
-            stdout = subprocess.PIPE,
-            stderr = subprocess.DEVNULL,
-            text = True,
-            check = True
-        )
-
-        return {
-            'proteome_filename': proteome_filename,
-            'success': True,
-            'fasta_path': str( dest_fasta ),
-            'command': ' '.join( makeblastdb_command ),
-            'stdout': result.stdout
-        }
-
-    except subprocess.CalledProcessError as error:
-        return {
-            'proteome_filename': proteome_filename,
-            'success': False,
-            'error': f"makeblastdb failed: {error.stderr}",
-            'command': ' '.join( makeblastdb_command )
-        }
-
-    except FileNotFoundError:
-        return {
-            'proteome_filename': proteome_filename,
-            'success': False,
-            'error': "makeblastdb not found. Is BLAST+ installed and in PATH?"
-        }
+    return makeblastdb_command
 
 
 # ============================================================================
@@ -267,35 +259,71 @@ def main():
     successful_count = 0
     failed_count = 0
 
-    with ProcessPoolExecutor( max_workers = arguments.parallel ) as executor:
-        future_to_proteome = {}
+    # Successes are reported as a running count about every 5% of proteomes;
+    # failures are still logged one line per proteome
+    progress_interval = max( 1, len( proteome_files ) // 20 )
 
-        for proteome_file in proteome_files:
-            future = executor.submit(
-                build_single_blastdb,
-                proteome_path = proteome_file,
-                blastdb_dir = blastdb_directory,
-                logger_name = 'build_per_genome_blastdbs'
-            )
-            future_to_proteome[ future ] = proteome_file
+    # makeblastdb is started directly with Popen and reaped with os.wait(), keeping
+    # up to --parallel builds running with no Python worker process per build
+    proteome_files_iterator = iter( proteome_files )
 
-        for future in as_completed( future_to_proteome ):
-            proteome_file = future_to_proteome[ future ]
+    # pid -> ( process, proteome_file ) for every running makeblastdb
+    pids___running_builds = {}
 
-            try:
-                result = future.result()
+    while True:
+        # Top the running set back up to --parallel builds
+        while len( pids___running_builds ) < arguments.parallel:
+            proteome_file = next( proteome_files_iterator, None )
+            if proteome_file is None:
+                break
 
-                if result[ 'success' ]:
-                    successful_count += 1
-                    logger.info( f"  SUCCESS: {result[ 'proteome_filename' ]}" )
-                    makeblastdb_commands.append( result.get( 'command', '' ) )
-                else:
-                    failed_count += 1
-                    logger.error( f"  FAILED: {result[ 'proteome_filename' ]} - {result.get( 'error', 'Unknown error' )}" )
+            # Copy FASTA to blastdb directory
+            dest_fasta = blastdb_directory / proteome_file.name
 
+            try:
+                fast_copy( proteome_file, dest_fasta )
             except Exception as error:
                 failed_count += 1
-                logger.error( f"  FAILED: {proteome_file.name} - Exception: {error}" )
+                logger.error( f"  FAILED: {proteome_file.name} - Failed to copy FASTA: {error}" )
+                continue
+
+            try:
+                # Suppress stderr to avoid thousands of "invalid residue" warnings
+                # (selenocysteine, pyrrolysine, etc.) which slow down execution
+                process = subprocess.Popen(
+                    build_makeblastdb_command( dest_fasta ),
+                    stdout = subprocess.DEVNULL,
+                    stderr = subprocess.DEVNULL
+                )
+            except FileNotFoundError:
+                failed_count += 1
+                logger.error( f"  FAILED: {proteome_file.name} - makeblastdb not found. Is BLAST+ installed and in PATH?" )
+                continue
+
+            pids___running_builds[ process.pid ] = ( process, proteome_file )
+
+        if not pids___running_builds:
+            break
+
+        # Block until any makeblastdb exits
+        pid, wait_status = os.wait()
+
+        if pid not in pids___running_builds:
+            continue
+
+        process, proteome_file = pids___running_builds.pop( pid )
+
+        # Hand the exit status to the Popen object so it does not try to reap the pid again
+        process.returncode = os.waitstatus_to_exitcode( wait_status )
+
+        if process.returncode == 0:
+            successful_count += 1
+            makeblastdb_commands.append( ' '.join( process.args ) )
+            if successful_count % progress_interval == 0:
+                logger.info( f"  SUCCESS: {successful_count} of {len( proteome_files )} databases built" )
+        else:
+            failed_count += 1
+            logger.error( f"  FAILED: {proteome_file.name} - makeblastdb failed with exit status {process.returncode}" )
 
     # ========================================================================
     # WRITE MAKEBLASTDB COMMANDS LOG
@@ -304,10 +332,13 @@ def main():
     logger.info( "" )
     logger.info( f"Writing makeblastdb commands to: {output_commands_path}" )
 
-    with open( output_commands_path, 'w' ) as output_commands:
-        for command in makeblastdb_commands:
-            output = command + '\n'
-            output_commands.write( output )
+    # Write to a temporary file and rename into place so an interrupted run
+    # never leaves a truncated log (an empty log stays an empty file)
+    temporary_commands_path = output_commands_path.with_name( output_commands_path.name + '.tmp' )
+    with open( temporary_commands_path, 'w', buffering = IO_BUFFER_BYTES ) as output_commands:
+        output = ''.join( command + '\n' for command in makeblastdb_commands )
+        output_commands.write( output )
+    os.replace( temporary_commands_path, output_commands_path )
 
     # ========================================================================
     # SUMMARY
@@ -28,10 +28,21 @@ Outputs:
 
 import argparse
 import logging
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+# 1 MiB file buffers for the species lists (fewer read/write syscalls on shared filesystems)
+IO_BUFFER_BYTES = 1 << 20
+
+# Phyloname schema Kingdom_Phylum_Class_Order_Family_Genus_species: genus_species is
+# everything after the fifth underscore, provided a further underscore follows the genus
+PHYLONAME_GENUS_SPECIES_PATTERN = re.compile( r'(?:[^_]*_){5}([^_]*_.*)', re.DOTALL )
+
+
 def setup_logging( output_dir: Path ) -> logging.Logger:
     """Set up logging to both file and console."""
     logger = logging.getLogger( 'validate_species_selection' )
@@ -57,6 +68,16 @@ def setup_logging( output_dir: Path ) -> logging.Logger:
     return logger
 
 
+@lru_cache( maxsize = None )
+def extract_genus_species_from_phyloname( phyloname: str ) -> str:
+    """Return genus_species (phyloname fields 6 onwards) or None for a short name; cached since many files share a phyloname."""
+    match = PHYLONAME_GENUS_SPECIES_PATTERN.fullmatch( phyloname )
+    if match is None:
+        return None
+    genus_species = match.group( 1 )
+    return genus_species
+
+
 def get_species_from_proteomes( proteomes_dir: Path ) -> set:
     """Extract species names from proteome filenames."""
     species_names = set()
@@ -64,24 +85,22 @@ def get_species_from_proteomes( proteomes_dir: Path ) -> set:
     if not proteomes_dir.exists():
         return species_names
 
-    for proteome_file in proteomes_dir.glob( '*.aa' ):
+    # os.scandir yields names directly (no Path object per entry)
+    with os.scandir( proteomes_dir ) as directory_entries:
+        proteome_filenames = [ entry.name for entry in directory_entries if entry.name.endswith( '.aa' ) ]
+
+    for proteome_filename in proteome_filenames:
         # Extract genus_species from GIGANTIC cleaned proteome filename
         # Format: phyloname-TX-proteome.aa (TX = T0, T1, etc.)
-        filename = proteome_file.stem
+        filename = proteome_filename[ :-3 ]
         # Strip -proteome suffix, then strip -TX suffix to get phyloname
         if '-proteome' in filename:
             phyloname = filename.split( '-proteome' )[ 0 ].rsplit( '-', 1 )[ 0 ]
         else:
             phyloname = filename
-        parts_filename = [ phyloname ]
-        if len( parts_filename ) >= 1:
-            phyloname = parts_filename[ 0 ]
-            parts_phyloname = phyloname.split( '_' )
-            if len( parts_phyloname ) >= 7:
-                genus = parts_phyloname[ 5 ]
-                species = '_'.join( parts_phyloname[ 6: ] )
-                genus_species = genus + '_' + species
-                species_names.add( genus_species )
+        genus_species = extract_genus_species_from_phyloname( phyloname )
+        if genus_species is not None:
+            species_names.add( genus_species )
 
     return species_names
 
@@ -95,24 +114,20 @@ def get_species_from_blastp( blastp_dir: Path ) -> set:
 
     # Look for .pdb files (BLAST+ protein database files)
     # Filenames: phyloname-T1-proteome.aa.pdb
-    for db_file in blastp_dir.glob( '*.pdb' ):
+    with os.scandir( blastp_dir ) as directory_entries:
+        db_filenames = [ entry.name for entry in directory_entries if entry.name.endswith( '.pdb' ) ]
+
+    for filename in db_filenames:
         # Extract genus_species from GIGANTIC filename
         # Remove .aa.pdb suffix to get phyloname-TX-proteome
-        filename = db_file.name
         # Strip -proteome.aa.pdb suffix, then strip -TX to get phyloname
         if '-proteome' in filename:
             phyloname = filename.split( '-proteome' )[ 0 ].rsplit( '-', 1 )[ 0 ]
         else:
             phyloname = filename.rsplit( '.', 2 )[ 0 ]
-        parts_filename = [ phyloname ]
-        if len( parts_filename ) >= 1:
-            phyloname = parts_filename[ 0 ]
-            parts_phyloname = phyloname.split( '_' )
-            if len( parts_phyloname ) >= 7:
-                genus = parts_phyloname[ 5 ]
-                species = '_'.join( parts_phyloname[ 6: ] )
-                genus_species = genus + '_' + species
-                species_names.add( genus_species )
+        genus_species = extract_genus_species_from_phyloname( phyloname )
+        if genus_species is not None:
+            species_names.add( genus_species )
 
     return species_names
 
@@ -125,19 +140,17 @@ def get_species_from_genome_annotations( genome_annotations_dir: Path ) -> set:
         return species_names
 
     # Genome annotation files are named: phyloname-genome.gff3 or phyloname-genome.gtf
-    for annotation_file in list( genome_annotations_dir.glob( '*.gff3' ) ) + list( genome_annotations_dir.glob( '*.gtf' ) ):
+    with os.scandir( genome_annotations_dir ) as directory_entries:
+        annotation_filenames = [ entry.name for entry in directory_entries if entry.name.endswith( ( '.gff3', '.gtf' ) ) ]
+
+    for annotation_filename in annotation_filenames:
         # Extract genus_species from phyloname portion
         # Format: phyloname-genome.gff3
-        filename = annotation_file.stem  # phyloname-genome
-        parts_filename = filename.split( '-genome' )
-        if len( parts_filename ) >= 1:
-            phyloname = parts_filename[ 0 ]
-            parts_phyloname = phyloname.split( '_' )
-            if len( parts_phyloname ) >= 7:
-                genus = parts_phyloname[ 5 ]
-                species = '_'.join( parts_phyloname[ 6: ] )
-                genus_species = genus + '_' + species
-                species_names.add( genus_species )
+        filename = annotation_filename.rsplit( '.', 1 )[ 0 ]  # phyloname-genome
+        phyloname = filename.split( '-genome' )[ 0 ]
+        genus_species = extract_genus_species_from_phyloname( phyloname )
+        if genus_species is not None:
+            species_names.add( genus_species )
 
     return species_names
 
@@ -149,7 +162,7 @@ def load_selected_species( selected_species_file: Path ) -> set:
     if not selected_species_file.exists():
         return species_names
 
-    with open( selected_species_file, 'r' ) as input_file:
+    with open( selected_species_file, 'r', buffering = IO_BUFFER_BYTES ) as input_file:
         for line in input_file:
             line = line.strip()
             # Skip empty lines and comments
@@ -195,7 +208,8 @@ def main():
 
     # Get species from STEP_2
     logger.info( f'Reading species from STEP_2: {step2_proteomes_dir}' )
-    step2_species = get_species_from_proteomes( step2_proteomes_dir )
+    # Frozen once; only used for membership and set differences from here on
+    step2_species = frozenset( get_species_from_proteomes( step2_proteomes_dir ) )
     logger.info( f'  Found {len( step2_species )} species in STEP_2' )
 
     if len( step2_species ) == 0:
@@ -206,7 +220,7 @@ def main():
 
     # Get species from STEP_3
     logger.info( f'Reading species from STEP_3: {step3_blastp_dir}' )
-    step3_species = get_species_from_blastp( step3_blastp_dir )
+    step3_species = frozenset( get_species_from_blastp( step3_blastp_dir ) )
     logger.info( f'  Found {len( step3_species )} species in STEP_3' )
 
     if len( step3_species ) == 0:
@@ -221,15 +235,16 @@ def main():
 
     if len( selected_species ) == 0:
         logger.info( '  No selection file found - using all species from STEP_2' )
-        selected_species = step2_species.copy()
+        selected_species = step2_species
     else:
         logger.info( f'  User selected {len( selected_species )} species' )
 
     # Validate selection against both STEP_2 and STEP_3
     logger.info( 'Validating species selection...' )
 
-    missing_from_step2 = selected_species - step2_species
-    missing_from_step3 = selected_species - step3_species
+    # The missing lists are only sorted on the error paths below
+    missing_from_step2 = selected_species.difference( step2_species )
+    missing_from_step3 = selected_species.difference( step3_species )
 
     if missing_from_step2:
         logger.error( f'CRITICAL ERROR: {len( missing_from_step2 )} species not found in STEP_2:' )
@@ -251,10 +266,12 @@ def main():
 
     # Write validated species list
     output_validated_list = output_dir / '1_ai-validated_species_list.txt'
-    with open( output_validated_list, 'w' ) as output_file:
-        for species_name in validated_species:
-            output = species_name + '\n'
-            output_file.write( output )
+    # Written to a temporary file and renamed into place so 002 never reads a partial list
+    temporary_validated_list = output_validated_list.with_name( output_validated_list.name + '.tmp' )
+    with open( temporary_validated_list, 'w', buffering = IO_BUFFER_BYTES ) as output_file:
+        output = ''.join( species_name + '\n' for species_name in validated_species )
+        output_file.write( output )
+    os.replace( temporary_validated_list, output_validated_list )
     logger.info( f'Wrote validated species list: {output_validated_list}' )
 
     # Write species count
@@ -273,8 +290,9 @@ def main():
         logger.info( f'  Found {len( all_annotation_species )} species with genome annotations in STEP_2' )
 
         # Filter to only include validated (selected) species
-        species_with_annotations = sorted( set( validated_species ) & all_annotation_species )
-        species_without_annotations = sorted( set( validated_species ) - all_annotation_species )
+        # selected_species already holds exactly the validated species as a set
+        species_with_annotations = sorted( selected_species & all_annotation_species )
+        species_without_annotations = sorted( selected_species - all_annotation_species )
 
         logger.info( f'  {len( species_with_annotations )} of {species_count} selected species have genome annotations' )
         logger.info( f'  {len( species_without_annotations )} selected species lack genome annotations' )
@@ -289,7 +307,7 @@ def main():
 
     # Write species with genome annotations list
     output_species_with_annotations = output_dir / '1_ai-species_with_genome_annotations.txt'
-    with open( output_species_with_annotations, 'w' ) as output_file:
+    with open( output_species_with_annotations, 'w', buffering = IO_BUFFER_BYTES ) as output_file:
         for species_name in species_with_annotations:
             output = species_name + '\n'
             output_file.write( output )
@@ -31,11 +31,35 @@ Outputs:
 
 import argparse
 import logging
+import os
+import re
 import shutil
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
+# Copies are I/O bound (the copy syscalls release the GIL), so several run at once
+# to overlap per-file open/stat latency on shared filesystems
+COPY_THREADS = min( 32, ( os.cpu_count() or 1 ) * 4 )
+
+# Copies submitted to the pool but not yet collected; keeps the queue (and the
+# futures held for it) bounded however many BLAST database files there are
+COPY_MAX_IN_FLIGHT = 2 * COPY_THREADS
+
+# Bytes requested per os.copy_file_range call (the kernel may copy less per call)
+COPY_CHUNK_BYTES = 1 << 30
+
+# 1 MiB file buffers for the species lists, the copy manifest and the fallback copy
+IO_BUFFER_BYTES = 1 << 20
+
+# Phyloname schema Kingdom_Phylum_Class_Order_Family_Genus_species: genus_species is
+# everything after the fifth underscore, provided a further underscore follows the genus
+PHYLONAME_GENUS_SPECIES_PATTERN = re.compile( r'(?:[^_]*_){5}([^_]*_.*)', re.DOTALL )
+
+
 def setup_logging( output_dir: Path ) -> logging.Logger:
     """Set up logging to both file and console."""
     logger = logging.getLogger( 'copy_selected_files' )
@@ -64,7 +88,7 @@ def setup_logging( output_dir: Path ) -> logging.Logger:
 def load_validated_species( validated_species_file: Path ) -> list:
     """Load validated species list."""
     species_names = []
-    with open( validated_species_file, 'r' ) as input_file:
+    with open( validated_species_file, 'r', buffering = IO_BUFFER_BYTES ) as input_file:
         for line in input_file:
             line = line.strip()
             if line:
@@ -79,51 +103,62 @@ def load_species_count( species_count_file: Path ) -> int:
     return count
 
 
-def find_proteome_files( proteomes_dir: Path, genus_species: str ) -> list:
-    """Find all proteome files for a given species (may include T0, T1 variants)."""
-    # Search for files containing the genus_species in the phyloname portion
+@lru_cache( maxsize = None )
+def extract_genus_species_from_phyloname( phyloname: str ) -> str:
+    """Return genus_species (phyloname fields 6 onwards) or None for a short name; cached since many files share a phyloname."""
+    match = PHYLONAME_GENUS_SPECIES_PATTERN.fullmatch( phyloname )
+    if match is None:
+        return None
+    genus_species = match.group( 1 )
+    return genus_species
+
+
+def build_proteome_index( proteomes_dir: Path ) -> dict:
+    """Scan the proteomes directory once and map genus_species to its proteome file DirEntry objects (may include T0, T1 variants)."""
     # Format: phyloname-TX-proteome.aa (TX = T0, T1, etc.)
-    matched_files = []
-    for proteome_file in proteomes_dir.glob( '*.aa' ):
-        filename = proteome_file.stem
-        # Strip -proteome suffix, then strip -TX to get phyloname
-        if '-proteome' in filename:
-            phyloname = filename.split( '-proteome' )[ 0 ].rsplit( '-', 1 )[ 0 ]
-        else:
-            phyloname = filename
-        parts_phyloname = phyloname.split( '_' )
-        if len( parts_phyloname ) >= 7:
-            genus = parts_phyloname[ 5 ]
-            species = '_'.join( parts_phyloname[ 6: ] )
-            file_genus_species = genus + '_' + species
-            if file_genus_species == genus_species:
-                matched_files.append( proteome_file )
-    return matched_files
-
-
-def find_blastp_files( blastp_dir: Path, genus_species: str ) -> list:
-    """Find all BLAST database files for a given species."""
+    genus_species___proteome_files = {}
+    with os.scandir( proteomes_dir ) as directory_entries:
+        for entry in directory_entries:
+            if not entry.name.endswith( '.aa' ):
+                continue
+            filename = entry.name[ :-3 ]
+            # Strip -proteome suffix, then strip -TX to get phyloname
+            if '-proteome' in filename:
+                phyloname = filename.split( '-proteome' )[ 0 ].rsplit( '-', 1 )[ 0 ]
+            else:
+                phyloname = filename
+            file_genus_species = extract_genus_species_from_phyloname( phyloname )
+            if file_genus_species is None:
+                continue
+            if file_genus_species not in genus_species___proteome_files:
+                genus_species___proteome_files[ file_genus_species ] = []
+            # The DirEntry already carries .name and .path; no Path object per file
+            genus_species___proteome_files[ file_genus_species ].append( entry )
+    return genus_species___proteome_files
+
+
+def build_blastp_index( blastp_dir: Path ) -> dict:
+    """Scan the BLAST databases directory once and map genus_species to its database file DirEntry objects."""
     # BLAST databases have multiple extensions: .pdb, .phr, .pin, .psq, etc.
     # Filenames: phyloname-TX-proteome.aa and phyloname-TX-proteome.aa.pdb etc.
-    db_files = []
-    for db_file in blastp_dir.glob( '*' ):
-        if db_file.is_file():
-            filename = db_file.name
+    genus_species___db_files = {}
+    with os.scandir( blastp_dir ) as directory_entries:
+        for entry in directory_entries:
+            if not entry.is_file():
+                continue
+            filename = entry.name
             # Strip -proteome and everything after, then strip -TX to get phyloname
             if '-proteome' in filename:
-                parts_filename = [ filename.split( '-proteome' )[ 0 ].rsplit( '-', 1 )[ 0 ] ]
+                phyloname = filename.split( '-proteome' )[ 0 ].rsplit( '-', 1 )[ 0 ]
             else:
-                parts_filename = [ filename ]
-            if len( parts_filename ) >= 1:
-                phyloname = parts_filename[ 0 ]
-                parts_phyloname = phyloname.split( '_' )
-                if len( parts_phyloname ) >= 7:
-                    genus = parts_phyloname[ 5 ]
-                    species = '_'.join( parts_phyloname[ 6: ] )
-                    file_genus_species = genus + '_' + species
-                    if file_genus_species == genus_species:
-                        db_files.append( db_file )
-    return db_files
+                phyloname = filename
+            file_genus_species = extract_genus_species_from_phyloname( phyloname )
+            if file_genus_species is None:
+                continue
+            if file_genus_species not in genus_species___db_files:
+                genus_species___db_files[ file_genus_species ] = []
+            genus_species___db_files[ file_genus_species ].append( entry )
+    return genus_species___db_files
 
 
 def find_genome_annotation_file( genome_annotations_dir: Path, genus_species: str ) -> Path:
@@ -131,19 +166,94 @@ def find_genome_annotation_file( genome_annotations_dir: Path, genus_species: st
     # Genome annotation files are named: phyloname-genome.gff3 or phyloname-genome.gtf
     for annotation_file in list( genome_annotations_dir.glob( '*.gff3' ) ) + list( genome_annotations_dir.glob( '*.gtf' ) ):
         filename = annotation_file.stem  # phyloname-genome
-        parts_filename = filename.split( '-genome' )
-        if len( parts_filename ) >= 1:
-            phyloname = parts_filename[ 0 ]
-            parts_phyloname = phyloname.split( '_' )
-            if len( parts_phyloname ) >= 7:
-                genus = parts_phyloname[ 5 ]
-                species = '_'.join( parts_phyloname[ 6: ] )
-                file_genus_species = genus + '_' + species
-                if file_genus_species == genus_species:
-                    return annotation_file
+        phyloname = filename.split( '-genome' )[ 0 ]
+        if extract_genus_species_from_phyloname( phyloname ) == genus_species:
+            return annotation_file
     return None
 
 
+def fast_copy( source_path: Path, dest_path: Path, preserve_metadata: bool ) -> None:
+    """Copy a file like shutil.copyfile (shutil.copy2 with preserve_metadata), moving the bytes inside the kernel with os.copy_file_range where possible."""
+    # The copy is written to a temporary file and renamed over the destination, so an
+    # existing destination is never opened for writing: after a --link run it is a hard
+    # link to the STEP_2/STEP_3 source, and truncating it would empty the source too
+    temporary_dest_path = os.fspath( dest_path ) + '.tmp'
+    # copy_file_range also lets CoW filesystems reflink and NFS 4.2 copy server-side
+    copy_file_range = getattr( os, 'copy_file_range', None )
+    try:
+        with open( source_path, 'rb' ) as input_file, open( temporary_dest_path, 'wb' ) as output_file:
+            try:
+                if copy_file_range is None:
+                    raise OSError( 'os.copy_file_range not available' )
+                while copy_file_range( input_file.fileno(), output_file.fileno(), COPY_CHUNK_BYTES ) > 0:
+                    pass
+            except OSError:
+                # Not supported here (other platform, filesystem or kernel): plain buffered copy from the start
+                input_file.seek( 0 )
+                output_file.seek( 0 )
+                output_file.truncate()
+                shutil.copyfileobj( input_file, output_file, IO_BUFFER_BYTES )
+        # Downstream steps only read file contents, so mode/timestamp syscalls are opt-in
+        if preserve_metadata:
+            shutil.copystat( source_path, temporary_dest_path )
+        os.replace( temporary_dest_path, dest_path )
+    except BaseException:
+        try:
+            os.unlink( temporary_dest_path )
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def link_or_copy( source_path: Path, dest_path: Path, preserve_metadata: bool ) -> None:
+    """Hard link source to destination; fall back to fast_copy when linking is not possible (e.g. across filesystems)."""
+    try:
+        os.link( source_path, dest_path )
+    except OSError:
+        fast_copy( source_path, dest_path, preserve_metadata )
+
+
+def replace_destination( source_path: Path, dest_path: Path, link_files: bool, preserve_metadata: bool ) -> None:
+    """Remove any existing destination, then hard link (link_files) or copy source to it."""
+    # A rerun replaces earlier output. The old destination may be a hard link to the
+    # source left by a --link run, so it is unlinked rather than ever written through
+    try:
+        os.unlink( dest_path )
+    except FileNotFoundError:
+        pass
+    if link_files:
+        link_or_copy( source_path, dest_path, preserve_metadata )
+    else:
+        fast_copy( source_path, dest_path, preserve_metadata )
+
+
+def copy_files( copy_pairs: list, progress_label: str, link_files: bool, preserve_metadata: bool, logger: logging.Logger ) -> int:
+    """Copy (or hard link) ( source, destination ) pairs concurrently and return the number copied."""
+    files_copied = 0
+    # Progress is logged about every 5% of files rather than every 10
+    progress_interval = max( 1, len( copy_pairs ) // 20 )
+    pending_copies = deque()
+    copy_pairs_iterator = iter( copy_pairs )
+    with ThreadPoolExecutor( max_workers = COPY_THREADS ) as executor:
+        while True:
+            # Top the pool back up to COPY_MAX_IN_FLIGHT submitted copies
+            while len( pending_copies ) < COPY_MAX_IN_FLIGHT:
+                copy_pair = next( copy_pairs_iterator, None )
+                if copy_pair is None:
+                    break
+                pending_copies.append( executor.submit( replace_destination, *copy_pair, link_files, preserve_metadata ) )
+
+            if not pending_copies:
+                break
+
+            # result() re-raises a copy error here, in the main thread
+            pending_copies.popleft().result()
+            files_copied += 1
+            if files_copied % progress_interval == 0:
+                logger.info( f'  Copied {files_copied} {progress_label}...' )
+    return files_copied
+
+
 def main():
     parser = argparse.ArgumentParser(
         description = 'Copy selected species files with speciesN naming'
@@ -162,6 +272,12 @@ def main():
                         help = 'Path to STEP_2 genome annotations directory (optional)' )
     parser.add_argument( '--output-dir', required = True,
                         help = 'Output directory' )
+    parser.add_argument( '--link', action = 'store_true', default = False,
+                        help = 'Hard link files instead of copying them when source and output share a filesystem '
+                               '(falls back to copying otherwise; linked files share content with the STEP_2/STEP_3 originals)' )
+    parser.add_argument( '--preserve-metadata', action = 'store_true', default = False,
+                        help = 'Also copy permission bits and timestamps to copied files, like cp -p '
+                               '(default: contents only; hard linked files always share them)' )
 
     args = parser.parse_args()
 
@@ -199,59 +315,69 @@ def main():
 
     logger.info( f'Proteomes output: {proteomes_output_dir}' )
     logger.info( f'BLASTP output: {blastp_output_dir}' )
+    if args.link:
+        logger.info( 'Hard linking files where possible (--link)' )
+    if args.preserve_metadata:
+        logger.info( 'Preserving permission bits and timestamps of copied files (--preserve-metadata)' )
 
     # Prepare manifest
     manifest_entries = []
     manifest_header = 'Source_Type (source step)\tGenus_Species (species name)\tSource_Path (original file path)\tDestination_Path (copied file path)'
     manifest_entries.append( manifest_header )
 
-    # Copy proteomes
+    # Collect proteomes
     logger.info( '' )
-    logger.info( 'Copying proteomes from STEP_2...' )
-    proteomes_copied = 0
+    logger.info( 'Collecting proteomes from STEP_2...' )
+    # One directory scan up front, then a dictionary lookup per species
+    genus_species___proteome_files = build_proteome_index( step2_proteomes_dir )
+    # Copy pairs and manifest entries are built as plain strings (no Path per file)
+    proteomes_output_directory = os.fspath( proteomes_output_dir )
+    proteome_copy_pairs = []
     for genus_species in validated_species:
-        proteome_files = find_proteome_files( step2_proteomes_dir, genus_species )
+        proteome_files = genus_species___proteome_files.get( genus_species, [] )
         if proteome_files:
             for proteome_file in proteome_files:
-                dest_file = proteomes_output_dir / proteome_file.name
-                shutil.copy2( proteome_file, dest_file )
-                proteomes_copied += 1
+                dest_file = os.path.join( proteomes_output_directory, proteome_file.name )
+                proteome_copy_pairs.append( ( proteome_file.path, dest_file ) )
 
-                output = 'proteome' + '\t' + genus_species + '\t' + str( proteome_file ) + '\t' + str( dest_file )
+                output = f'proteome\t{genus_species}\t{proteome_file.path}\t{dest_file}'
                 manifest_entries.append( output )
-
-            if proteomes_copied % 10 == 0:
-                logger.info( f'  Copied {proteomes_copied} proteomes...' )
         else:
             logger.error( f'CRITICAL ERROR: Proteome not found for {genus_species}' )
             sys.exit( 1 )
 
-    logger.info( f'  Copied {proteomes_copied} proteomes' )
+    logger.info( f'  Found {len( proteome_copy_pairs )} proteomes' )
 
-    # Copy BLAST databases
-    logger.info( '' )
-    logger.info( 'Copying BLAST databases from STEP_3...' )
+    # Collect BLAST databases
+    logger.info( 'Collecting BLAST databases from STEP_3...' )
     blastp_species_copied = 0
-    blastp_files_copied = 0
+    genus_species___db_files = build_blastp_index( step3_blastp_dir )
+    blastp_output_directory = os.fspath( blastp_output_dir )
+    blastp_copy_pairs = []
     for genus_species in validated_species:
-        db_files = find_blastp_files( step3_blastp_dir, genus_species )
+        db_files = genus_species___db_files.get( genus_species, [] )
         if db_files:
             for db_file in db_files:
-                dest_file = blastp_output_dir / db_file.name
-                shutil.copy2( db_file, dest_file )
-                blastp_files_copied += 1
+                dest_file = os.path.join( blastp_output_directory, db_file.name )
+                blastp_copy_pairs.append( ( db_file.path, dest_file ) )
 
-                output = 'blastp' + '\t' + genus_species + '\t' + str( db_file ) + '\t' + str( dest_file )
+                output = f'blastp\t{genus_species}\t{db_file.path}\t{dest_file}'
                 manifest_entries.append( output )
 
             blastp_species_copied += 1
-            if blastp_species_copied % 10 == 0:
-                logger.info( f'  Copied databases for {blastp_species_copied} species...' )
         else:
             logger.error( f'CRITICAL ERROR: BLAST databases not found for {genus_species}' )
             sys.exit( 1 )
 
-    logger.info( f'  Copied {blastp_files_copied} BLAST database files for {blastp_species_copied} species' )
+    logger.info( f'  Found {len( blastp_copy_pairs )} BLAST database files for {blastp_species_copied} species' )
+
+    # Copy proteomes and BLAST databases through one pool so the two sets overlap
+    # (copy_files stops the run at the first failed copy, so every pair is copied on return)
+    logger.info( '' )
+    logger.info( 'Copying proteomes and BLAST databases...' )
+    copy_files( proteome_copy_pairs + blastp_copy_pairs, 'proteome and BLAST database files', args.link, args.preserve_metadata, logger )
+    logger.info( f'  Copied {len( proteome_copy_pairs )} proteomes' )
+    logger.info( f'  Copied {len( blastp_copy_pairs )} BLAST database files for {blastp_species_copied} species' )
 
     # Copy genome annotations (optional - only species that have them)
     # Always create the directory so Nextflow outputs are consistent
@@ -267,23 +393,21 @@ def main():
             logger.info( f'Copying genome annotations from STEP_2 ({len( species_with_annotations )} species with annotations)...' )
             logger.info( f'Genome annotations output: {genome_annotations_output_dir}' )
 
+            annotation_copy_pairs = []
             for genus_species in species_with_annotations:
                 annotation_file = find_genome_annotation_file( step2_genome_annotations_dir, genus_species )
                 if annotation_file:
                     # Follow symlinks and copy actual file content
                     source_path = annotation_file.resolve()
                     dest_file = genome_annotations_output_dir / annotation_file.name
-                    shutil.copy2( source_path, dest_file )
-                    annotations_copied += 1
+                    annotation_copy_pairs.append( ( source_path, dest_file ) )
 
-                    output = 'genome_annotation' + '\t' + genus_species + '\t' + str( annotation_file ) + '\t' + str( dest_file )
+                    output = f'genome_annotation\t{genus_species}\t{annotation_file}\t{dest_file}'
                     manifest_entries.append( output )
-
-                    if annotations_copied % 10 == 0:
-                        logger.info( f'  Copied {annotations_copied} genome annotations...' )
                 else:
                     logger.warning( f'  WARNING: Genome annotation file not found for {genus_species} (listed in species_with_annotations but file missing)' )
 
+            annotations_copied = copy_files( annotation_copy_pairs, 'genome annotations', args.link, args.preserve_metadata, logger )
             logger.info( f'  Copied {annotations_copied} genome annotation files' )
         else:
             logger.info( '' )
@@ -294,10 +418,12 @@ def main():
 
     # Write manifest
     manifest_file = output_dir / '2_ai-copy_manifest.tsv'
-    with open( manifest_file, 'w' ) as output_file:
-        for entry in manifest_entries:
-            output = entry + '\n'
-            output_file.write( output )
+    # Written to a temporary file and renamed into place so an interrupted run never leaves a partial manifest
+    temporary_manifest_file = manifest_file.with_name( manifest_file.name + '.tmp' )
+    with open( temporary_manifest_file, 'w', buffering = IO_BUFFER_BYTES ) as output_file:
+        output = '\n'.join( manifest_entries ) + '\n'
+        output_file.write( output )
+    os.replace( temporary_manifest_file, manifest_file )
     logger.info( '' )
     logger.info( f'Wrote copy manifest: {manifest_file}' )
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# AI: Claude Code | Opus 4.6 | 2026 October 16 | Purpose: Check that script 002 reruns never modify STEP_2/STEP_3 source files
+# Human: Eric Edsinger
+
+"""
+Validation test for 002_ai-python-copy_selected_files.py
+
+A --link run leaves every destination hard linked to its STEP_2 proteome or
+STEP_3 BLAST database file. A later run (with or without --link) must replace
+those destinations without writing through the links into the sources.
+
+Usage:
+    python3 test_002_copy_selected_files.py
+"""
+
+import hashlib
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPT_PATH = Path( __file__ ).resolve().parent.parent / 'scripts' / '002_ai-python-copy_selected_files.py'
+
+PHYLONAME_PREFIX = 'Kingdom_Phylum_Class_Order_Family_'
+SPECIES_NAMES = [ 'Aaa_bbb', 'Ccc_ddd' ]
+
+
+def file_checksums( directory: Path ) -> dict:
+    """Map each file name in directory to the MD5 of its contents."""
+    file_names___checksums = {}
+    for file_path in sorted( directory.iterdir() ):
+        file_names___checksums[ file_path.name ] = hashlib.md5( file_path.read_bytes() ).hexdigest()
+    return file_names___checksums
+
+
+class TestRerunAfterLink( unittest.TestCase ):
+
+    def setUp( self ):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.work_dir = Path( self.temporary_directory.name )
+
+        self.step2_proteomes_dir = self.work_dir / 'step2_proteomes'
+        self.step3_blastp_dir = self.work_dir / 'step3_blastp'
+        self.step2_proteomes_dir.mkdir()
+        self.step3_blastp_dir.mkdir()
+
+        for genus_species in SPECIES_NAMES:
+            proteome_name = f'{PHYLONAME_PREFIX}{genus_species}-T1-proteome.aa'
+            output = ''.join( f'>{genus_species}_{index}\nMKVLAAGIVALLLAAGCSS\n' for index in range( 400 ) )
+            ( self.step2_proteomes_dir / proteome_name ).write_text( output )
+            for extension in [ '.pdb', '.phr', '.pin', '.psq' ]:
+                ( self.step3_blastp_dir / ( proteome_name + extension ) ).write_bytes( ( genus_species + extension ).encode() * 500 )
+
+        self.validated_species_file = self.work_dir / 'validated_species.txt'
+        self.validated_species_file.write_text( '\n'.join( SPECIES_NAMES ) + '\n' )
+        self.species_count_file = self.work_dir / 'species_count.txt'
+        self.species_count_file.write_text( f'{len( SPECIES_NAMES )}\n' )
+
+        self.output_dir = self.work_dir / 'output'
+
+    def tearDown( self ):
+        self.temporary_directory.cleanup()
+
+    def run_copy( self, extra_arguments: list ) -> None:
+        command = [
+            sys.executable, str( SCRIPT_PATH ),
+            '--validated-species', str( self.validated_species_file ),
+            '--species-count', str( self.species_count_file ),
+            '--step2-proteomes', str( self.step2_proteomes_dir ),
+            '--step3-blastp', str( self.step3_blastp_dir ),
+            '--output-dir', str( self.output_dir )
+        ] + extra_arguments
+        subprocess.run( command, check = True, stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL )
+
+    def test_copy_after_link_keeps_sources( self ):
+        proteome_checksums = file_checksums( self.step2_proteomes_dir )
+        blastp_checksums = file_checksums( self.step3_blastp_dir )
+
+        self.run_copy( [ '--link' ] )
+        self.run_copy( [] )
+
+        self.assertEqual( file_checksums( self.step2_proteomes_dir ), proteome_checksums )
+        self.assertEqual( file_checksums( self.step3_blastp_dir ), blastp_checksums )
+
+        # Destinations are now independent copies with the source contents
+        proteomes_output_dir = self.output_dir / f'species{len( SPECIES_NAMES )}_gigantic_T1_proteomes'
+        blastp_output_dir = self.output_dir / f'species{len( SPECIES_NAMES )}_gigantic_T1_blastp'
+        self.assertEqual( file_checksums( proteomes_output_dir ), proteome_checksums )
+        self.assertEqual( file_checksums( blastp_output_dir ), blastp_checksums )
+        for dest_path in list( proteomes_output_dir.iterdir() ) + list( blastp_output_dir.iterdir() ):
+            self.assertEqual( dest_path.stat().st_nlink, 1 )
+
+    def test_link_after_link_keeps_sources( self ):
+        proteome_checksums = file_checksums( self.step2_proteomes_dir )
+        blastp_checksums = file_checksums( self.step3_blastp_dir )
+
+        self.run_copy( [ '--link' ] )
+        self.run_copy( [ '--link' ] )
+
+        self.assertEqual( file_checksums( self.step2_proteomes_dir ), proteome_checksums )
+        self.assertEqual( file_checksums( self.step3_blastp_dir ), blastp_checksums )
+
+
+if __name__ == '__main__':
+    unittest.main()
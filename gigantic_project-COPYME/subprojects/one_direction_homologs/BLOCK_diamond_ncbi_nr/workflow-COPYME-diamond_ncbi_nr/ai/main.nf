@@ -168,7 +168,8 @@ process identify_top_hits {
         --input-file ${combined_file} \
         --output-dir . \
         --species-name ${species_name} \
-        --proteome-file ${proteome_file}
+        --proteome-file ${proteome_file} \
+        --workers ${task.cpus}
     """
 }
 
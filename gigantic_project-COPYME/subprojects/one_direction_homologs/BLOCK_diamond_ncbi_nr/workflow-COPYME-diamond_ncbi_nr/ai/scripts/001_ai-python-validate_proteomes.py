@@ -6,7 +6,7 @@
 001_ai-python-validate_proteomes.py
 
 Validates the proteome manifest and all referenced proteome FASTA files.
-Ensures files exist, are non-empty, and contain valid FASTA sequences.
+Ensures files exist, are non-empty, and contain FASTA records (header lines).
 
 Input:
     Proteome manifest TSV with columns: species_name, proteome_path, phyloname
@@ -19,18 +19,28 @@ Usage:
 """
 
 import argparse
+import csv
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+sys.path.insert( 0, str( Path( __file__ ).parent ) )
+from utils_fasta import count_fasta_records
 
-def setup_logging( output_dir ):
-    """Configure logging to both console and file."""
+# Proteomes are checked concurrently: on networked storage each stat/open/read waits on
+# the file server, and several checks in flight hide that latency
+VALIDATION_THREADS = min( 16, ( os.cpu_count() or 1 ) * 2 )
+
+
+def setup_logging( output_dir, verbose = False ):
+    """Configure logging to both console and file (per-species detail only when verbose)."""
 
     log_file = Path( output_dir ) / "1_ai-log-validate_proteomes.log"
 
     logging.basicConfig(
-        level = logging.INFO,
+        level = logging.DEBUG if verbose else logging.INFO,
         format = "%(asctime)s | %(levelname)s | %(message)s",
         handlers = [
             logging.FileHandler( log_file ),
@@ -41,40 +51,43 @@ def setup_logging( output_dir ):
     return logging.getLogger( __name__ )
 
 
-def validate_fasta( fasta_path, logger ):
-    """Check that a file contains valid FASTA format sequences."""
-
-    sequence_count = 0
-    current_sequence_length = 0
+def validate_fasta( fasta_path ):
+    """Count the FASTA records in a proteome; a proteome with none fails validation."""
 
-    with open( fasta_path, 'r' ) as input_fasta:
-        for line in input_fasta:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith( '>' ):
-                if sequence_count > 0 and current_sequence_length == 0:
-                    logger.warning( f"  Empty sequence found before header: {line[ :50 ]}" )
-                sequence_count += 1
-                current_sequence_length = 0
-            else:
-                current_sequence_length += len( line )
+    # Only the record count is needed downstream, so sequence lines are never parsed
+    sequence_count = count_fasta_records( fasta_path )
 
     return sequence_count
 
 
+def check_proteome( proteome_file ):
+    """Stat and validate one proteome; return ( file_size, sequence_count ) with file_size None if missing."""
+
+    # One stat both checks existence and gives the size
+    try:
+        file_size = proteome_file.stat().st_size
+    except ( FileNotFoundError, NotADirectoryError ):
+        return None, 0
+
+    if file_size == 0:
+        return file_size, 0
+
+    return file_size, validate_fasta( proteome_file )
+
+
 def main():
 
     parser = argparse.ArgumentParser( description = "Validate proteome files and manifest" )
     parser.add_argument( "--manifest", required = True, help = "Path to proteome manifest TSV" )
     parser.add_argument( "--output-dir", required = True, help = "Output directory for validated manifest" )
+    parser.add_argument( "--verbose", action = "store_true", help = "Also log every valid proteome (DEBUG level)" )
     arguments = parser.parse_args()
 
     input_manifest_path = Path( arguments.manifest )
     output_directory = Path( arguments.output_dir )
     output_directory.mkdir( parents = True, exist_ok = True )
 
-    logger = setup_logging( output_directory )
+    logger = setup_logging( output_directory, arguments.verbose )
     logger.info( "=" * 72 )
     logger.info( "Script 001: Validate Proteomes" )
     logger.info( "=" * 72 )
@@ -98,72 +111,96 @@ def main():
     total_sequences = 0
     errors_found = 0
 
+    # ( species_name, proteome_file, phyloname ) for every well-formed row, in manifest order
+    manifest_rows = []
+
+    # Relative proteome paths hang off the manifest's directory: resolve it once here, so
+    # each row only needs a string normalisation rather than a realpath walk of its own
+    manifest_parent = input_manifest_path.parent.resolve()
+
     # species_name	proteome_path	phyloname
     # Homo_sapiens	../../../../genomesDB/output_to_input/STEP_4-create_final_species_set/...aa	Metazoa_Chordata_..._Homo_sapiens
     with open( input_manifest_path, 'r' ) as input_manifest:
 
         header_line = None
 
-        for line in input_manifest:
-            line = line.strip()
+        # Rows are split on tabs by the C csv parser; no quoting, so fields are taken literally
+        for parts in csv.reader( input_manifest, delimiter = '\t', quoting = csv.QUOTE_NONE ):
 
-            # Skip empty lines and comments
-            if not line or line.startswith( '#' ):
+            # Skip empty lines (including whitespace- and tab-only ones) and comments
+            if not any( field.strip() for field in parts ):
+                continue
+            if parts[ 0 ].lstrip().startswith( '#' ):
                 continue
 
             # Capture header
             if header_line is None:
-                header_line = line
-                parts = line.split( '\t' )
+                header_line = '\t'.join( parts ).strip()
                 if len( parts ) < 2:
                     logger.error( "CRITICAL ERROR: Manifest header must have at least 2 tab-separated columns" )
-                    logger.error( f"Got: {line}" )
+                    logger.error( f"Got: {header_line}" )
                     sys.exit( 1 )
-                logger.info( f"Manifest header: {line}" )
+                logger.info( f"Manifest header: {header_line}" )
                 continue
 
             # Parse data rows
-            parts = line.split( '\t' )
             if len( parts ) < 2:
-                logger.warning( f"Skipping malformed line (too few columns): {line[ :80 ]}" )
+                logger.warning( f"Skipping malformed line (too few columns): {parts[ 0 ].strip()[ :80 ]}" )
                 errors_found += 1
                 continue
 
-            species_name = parts[ 0 ]
-            proteome_path = parts[ 1 ]
-            phyloname = parts[ 2 ] if len( parts ) > 2 else ""
+            species_name = parts[ 0 ].strip()
+            proteome_path = parts[ 1 ].strip()
+            phyloname = parts[ 2 ].strip() if len( parts ) > 2 else ""
+
+            if not species_name or not proteome_path:
+                line_text = '\t'.join( parts ).strip()
+                logger.warning( f"Skipping malformed line (empty species or proteome path): {line_text[ :80 ]}" )
+                errors_found += 1
+                continue
 
             # Resolve proteome path (may be relative to manifest location)
             proteome_file = Path( proteome_path )
             if not proteome_file.is_absolute():
-                proteome_file = input_manifest_path.parent / proteome_file
+                proteome_file = manifest_parent / proteome_file
+
+            manifest_rows.append( ( species_name, proteome_file, phyloname ) )
+
+    # ========================================================================
+    # Validate proteome files
+    # ========================================================================
+
+    with ThreadPoolExecutor( max_workers = VALIDATION_THREADS ) as executor:
+        proteome_checks = executor.map( check_proteome, [ proteome_file for species_name, proteome_file, phyloname in manifest_rows ] )
+
+        # Results come back in manifest order
+        for ( species_name, proteome_file, phyloname ), ( file_size, sequence_count ) in zip( manifest_rows, proteome_checks ):
 
             # Check file exists
-            if not proteome_file.exists():
+            if file_size is None:
                 logger.error( f"  MISSING: {species_name} - {proteome_file}" )
                 errors_found += 1
                 continue
 
             # Check file is non-empty
-            file_size = proteome_file.stat().st_size
             if file_size == 0:
                 logger.error( f"  EMPTY: {species_name} - {proteome_file}" )
                 errors_found += 1
                 continue
 
             # Validate FASTA format
-            sequence_count = validate_fasta( proteome_file, logger )
             if sequence_count == 0:
                 logger.error( f"  NO SEQUENCES: {species_name} - {proteome_file}" )
                 errors_found += 1
                 continue
 
             total_sequences += sequence_count
-            logger.info( f"  VALID: {species_name} - {sequence_count} sequences ({file_size / 1024 / 1024:.1f} MB)" )
+            # Per-proteome success lines are detail; the summary carries the totals
+            logger.debug( "  VALID: %s - %d sequences (%.1f MB)", species_name, sequence_count, file_size / 1024 / 1024 )
 
             validated_entries.append( {
                 'species_name': species_name,
-                'proteome_path': str( proteome_file.resolve() ),
+                'proteome_path': os.path.normpath( proteome_file ),
                 'phyloname': phyloname,
                 'sequence_count': sequence_count
             } )
@@ -194,12 +231,12 @@ def main():
         output += "Sequence_Count (number of protein sequences in proteome)\n"
         output_manifest.write( output )
 
-        for entry in validated_entries:
-            output = entry[ 'species_name' ] + '\t'
-            output += entry[ 'proteome_path' ] + '\t'
-            output += entry[ 'phyloname' ] + '\t'
-            output += str( entry[ 'sequence_count' ] ) + '\n'
-            output_manifest.write( output )
+        # Rows are formatted by the C csv writer; no quoting, so a field containing a tab is an error
+        manifest_writer = csv.writer( output_manifest, delimiter = '\t', lineterminator = '\n', quoting = csv.QUOTE_NONE, quotechar = None )
+        manifest_writer.writerows(
+            ( entry[ 'species_name' ], entry[ 'proteome_path' ], entry[ 'phyloname' ], entry[ 'sequence_count' ] )
+            for entry in validated_entries
+        )
 
     # ========================================================================
     # Summary
@@ -23,18 +23,28 @@ Usage:
 """
 
 import argparse
+import csv
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+sys.path.insert( 0, str( Path( __file__ ).parent ) )
+from utils_fasta import count_fasta_records
 
-def setup_logging( output_dir ):
-    """Configure logging to both console and file."""
+# 1 MiB file buffers for streaming proteomes into their split files
+IO_BUFFER_BYTES = 1 << 20
+
+
+def setup_logging( output_dir, verbose = False ):
+    """Configure logging to both console and file (per-species detail only when verbose)."""
 
     log_file = Path( output_dir ) / "2_ai-log-split_proteomes_for_diamond.log"
 
     logging.basicConfig(
-        level = logging.INFO,
+        level = logging.DEBUG if verbose else logging.INFO,
         format = "%(asctime)s | %(levelname)s | %(message)s",
         handlers = [
             logging.FileHandler( log_file ),
@@ -45,31 +55,94 @@ def setup_logging( output_dir ):
     return logging.getLogger( __name__ )
 
 
-def read_fasta( fasta_path ):
-    """Read a FASTA file and return list of (header, sequence) tuples."""
+def advise_file_access( input_file, advice_name ):
+    """Pass an access pattern hint (e.g. 'POSIX_FADV_SEQUENTIAL') for a whole open file; no-op where unsupported."""
+
+    advice = getattr( os, advice_name, None )
+    if advice is None:
+        return
+
+    try:
+        os.posix_fadvise( input_file.fileno(), 0, 0, advice )
+    except OSError:
+        pass
+
+
+def iter_fasta_records( fasta_path ):
+    """Yield (header, sequence) byte strings one record at a time, sequence lines joined unwrapped."""
 
-    sequences = []
     current_header = None
     current_sequence_parts = []
 
-    with open( fasta_path, 'r' ) as input_fasta:
-        for line in input_fasta:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith( '>' ):
-                if current_header is not None:
-                    sequences.append( ( current_header, ''.join( current_sequence_parts ) ) )
-                current_header = line
-                current_sequence_parts = []
-            else:
-                current_sequence_parts.append( line )
+    with open( fasta_path, 'rb', buffering = IO_BUFFER_BYTES ) as input_fasta:
+        # Streamed once front to back: wide readahead, and the proteome's pages are
+        # dropped from the page cache once split (it is not read again)
+        advise_file_access( input_fasta, 'POSIX_FADV_SEQUENTIAL' )
+        try:
+            for line in input_fasta:
+                # Headers are recognised exactly as count_fasta_records counts them
+                if line[ :1 ] == b'>':
+                    if current_header is not None:
+                        yield current_header, b''.join( current_sequence_parts )
+                    current_header = line.rstrip()
+                    current_sequence_parts = []
+                else:
+                    line = line.strip()
+                    if line:
+                        current_sequence_parts.append( line )
+
+            # Don't forget the last sequence
+            if current_header is not None:
+                yield current_header, b''.join( current_sequence_parts )
+        finally:
+            advise_file_access( input_fasta, 'POSIX_FADV_DONTNEED' )
+
+
+def split_one_species( species_name, proteome_path, number_of_parts, splits_directory ):
+    """
+    Split one proteome into up to number_of_parts FASTA files in splits_directory.
+
+    Returns ( total_sequences, part_entries ) with one ( part_number, part_filepath,
+    sequence_count ) tuple per file written; nothing is written when the proteome
+    has no sequences. Runs in a worker process, so it logs nothing itself.
+    """
+
+    # Count first so the part sizes are known, then stream the records into the parts
+    # in one pass; only one record is held in memory at a time
+    total_sequences = count_fasta_records( proteome_path )
+
+    part_entries = []
+
+    if total_sequences == 0:
+        return total_sequences, part_entries
+
+    # Calculate sequences per part
+    sequences_per_part = total_sequences // number_of_parts
+    remainder = total_sequences % number_of_parts
+
+    # Distribute sequences across parts
+    # First 'remainder' parts get one extra sequence
+    fasta_records = iter_fasta_records( proteome_path )
+
+    for part_number in range( 1, number_of_parts + 1 ):
+
+        part_size = sequences_per_part + ( 1 if part_number <= remainder else 0 )
+
+        if part_size == 0:
+            # Skip empty parts (happens when total < num_parts)
+            continue
 
-    # Don't forget the last sequence
-    if current_header is not None:
-        sequences.append( ( current_header, ''.join( current_sequence_parts ) ) )
+        part_filename = f"{species_name}_part_{part_number:03d}.fasta"
+        part_filepath = splits_directory / part_filename
 
-    return sequences
+        with open( part_filepath, 'wb', buffering = IO_BUFFER_BYTES ) as output_fasta:
+            for header, sequence in islice( fasta_records, part_size ):
+                output = header + b'\n' + sequence + b'\n'
+                output_fasta.write( output )
+
+        part_entries.append( ( part_number, str( part_filepath ), part_size ) )
+
+    return total_sequences, part_entries
 
 
 def main():
@@ -78,6 +151,9 @@ def main():
     parser.add_argument( "--manifest", required = True, help = "Path to validated proteome manifest" )
     parser.add_argument( "--output-dir", required = True, help = "Output directory" )
     parser.add_argument( "--num-parts", type = int, default = 40, help = "Number of parts per species (default: 40)" )
+    parser.add_argument( "--workers", type = int, default = len( os.sched_getaffinity( 0 ) ) if hasattr( os, 'sched_getaffinity' ) else ( os.cpu_count() or 1 ),
+                         help = "Species split in parallel worker processes (default: CPUs available to this process)" )
+    parser.add_argument( "--verbose", action = "store_true", help = "Also log every species as it is split (DEBUG level)" )
     arguments = parser.parse_args()
 
     input_manifest_path = Path( arguments.manifest )
@@ -88,13 +164,14 @@ def main():
     splits_directory = output_directory / "splits"
     splits_directory.mkdir( parents = True, exist_ok = True )
 
-    logger = setup_logging( output_directory )
+    logger = setup_logging( output_directory, arguments.verbose )
     logger.info( "=" * 72 )
     logger.info( "Script 002: Split Proteomes for DIAMOND" )
     logger.info( "=" * 72 )
     logger.info( f"Input manifest: {input_manifest_path}" )
     logger.info( f"Output directory: {output_directory}" )
     logger.info( f"Parts per species: {number_of_parts}" )
+    logger.info( f"Worker processes: {arguments.workers}" )
 
     # ========================================================================
     # Read manifest
@@ -110,17 +187,24 @@ def main():
     # Homo_sapiens	/path/to/proteome.aa	Metazoa_..._Homo_sapiens	20000
     with open( input_manifest_path, 'r' ) as input_manifest:
         header_skipped = False
-        for line in input_manifest:
-            line = line.strip()
-            if not line or line.startswith( '#' ):
+        # Rows are split on tabs by the C csv parser; no quoting, so fields are taken literally
+        for parts in csv.reader( input_manifest, delimiter = '\t', quoting = csv.QUOTE_NONE ):
+            # Skip empty lines (including whitespace- and tab-only ones) and comments
+            if not any( field.strip() for field in parts ):
+                continue
+            if parts[ 0 ].lstrip().startswith( '#' ):
                 continue
             if not header_skipped:
                 header_skipped = True
                 continue
 
-            parts = line.split( '\t' )
-            species_name = parts[ 0 ]
-            proteome_path = parts[ 1 ]
+            if len( parts ) < 2 or not parts[ 0 ].strip() or not parts[ 1 ].strip():
+                line_text = '\t'.join( parts ).strip()
+                logger.warning( f"Skipping malformed line (empty species or proteome path): {line_text[ :80 ]}" )
+                continue
+
+            species_name = parts[ 0 ].strip()
+            proteome_path = parts[ 1 ].strip()
             species_entries.append( ( species_name, proteome_path ) )
 
     logger.info( f"Species to split: {len( species_entries )}" )
@@ -131,54 +215,46 @@ def main():
 
     job_manifest_entries = []
     job_number = 0
-
-    for species_name, proteome_path in species_entries:
-
-        logger.info( f"  Splitting: {species_name}" )
-
-        sequences = read_fasta( proteome_path )
-        total_sequences = len( sequences )
-
-        if total_sequences == 0:
-            logger.error( f"  CRITICAL ERROR: No sequences in {proteome_path}" )
-            sys.exit( 1 )
-
-        # Calculate sequences per part
-        sequences_per_part = total_sequences // number_of_parts
-        remainder = total_sequences % number_of_parts
-
-        # Distribute sequences across parts
-        # First 'remainder' parts get one extra sequence
-        sequence_index = 0
-
-        for part_number in range( 1, number_of_parts + 1 ):
-
-            part_size = sequences_per_part + ( 1 if part_number <= remainder else 0 )
-
-            if part_size == 0:
-                # Skip empty parts (happens when total < num_parts)
-                continue
-
-            part_filename = f"{species_name}_part_{part_number:03d}.fasta"
-            part_filepath = splits_directory / part_filename
-
-            with open( part_filepath, 'w' ) as output_fasta:
-                for i in range( part_size ):
-                    header, sequence = sequences[ sequence_index ]
-                    output = header + '\n' + sequence + '\n'
-                    output_fasta.write( output )
-                    sequence_index += 1
-
-            job_number += 1
-            job_manifest_entries.append( {
-                'job_number': job_number,
-                'species_name': species_name,
-                'part_number': part_number,
-                'input_fasta': str( part_filepath ),
-                'sequence_count': part_size
-            } )
-
-        logger.info( f"    {total_sequences} sequences -> {min( number_of_parts, total_sequences )} parts" )
+    all_species_sequences = 0
+
+    # Species are independent, so they are split in parallel worker processes;
+    # map() hands the results back in manifest order, and job numbers are
+    # assigned here so they stay sequential in that order
+    species_names = [ species_name for species_name, proteome_path in species_entries ]
+    proteome_paths = [ proteome_path for species_name, proteome_path in species_entries ]
+    worker_count = max( 1, min( arguments.workers, len( species_entries ) ) )
+
+    with ProcessPoolExecutor( max_workers = worker_count ) as executor:
+        split_results = executor.map(
+            split_one_species,
+            species_names,
+            proteome_paths,
+            [ number_of_parts ] * len( species_entries ),
+            [ splits_directory ] * len( species_entries )
+        )
+
+        for ( species_name, proteome_path ), ( total_sequences, part_entries ) in zip( species_entries, split_results ):
+
+            # Per-species lines are detail; the summary carries the totals
+            logger.debug( "  Splitting: %s", species_name )
+
+            if total_sequences == 0:
+                logger.error( f"  CRITICAL ERROR: No sequences in {proteome_path}" )
+                executor.shutdown( wait = False, cancel_futures = True )
+                sys.exit( 1 )
+
+            for part_number, part_filepath, part_size in part_entries:
+                job_number += 1
+                job_manifest_entries.append( {
+                    'job_number': job_number,
+                    'species_name': species_name,
+                    'part_number': part_number,
+                    'input_fasta': part_filepath,
+                    'sequence_count': part_size
+                } )
+
+            all_species_sequences += total_sequences
+            logger.debug( "    %d sequences -> %d parts", total_sequences, min( number_of_parts, total_sequences ) )
 
     # ========================================================================
     # Write job manifest
@@ -195,13 +271,12 @@ def main():
         output += "Sequence_Count (number of sequences in this split)\n"
         output_manifest.write( output )
 
-        for entry in job_manifest_entries:
-            output = str( entry[ 'job_number' ] ) + '\t'
-            output += entry[ 'species_name' ] + '\t'
-            output += str( entry[ 'part_number' ] ) + '\t'
-            output += entry[ 'input_fasta' ] + '\t'
-            output += str( entry[ 'sequence_count' ] ) + '\n'
-            output_manifest.write( output )
+        # Rows are formatted by the C csv writer; no quoting, so a field containing a tab is an error
+        manifest_writer = csv.writer( output_manifest, delimiter = '\t', lineterminator = '\n', quoting = csv.QUOTE_NONE, quotechar = None )
+        manifest_writer.writerows(
+            ( entry[ 'job_number' ], entry[ 'species_name' ], entry[ 'part_number' ], entry[ 'input_fasta' ], entry[ 'sequence_count' ] )
+            for entry in job_manifest_entries
+        )
 
     # ========================================================================
     # Summary
@@ -212,6 +287,7 @@ def main():
     logger.info( "Split Summary" )
     logger.info( "=" * 72 )
     logger.info( f"Species processed: {len( species_entries )}" )
+    logger.info( f"Total sequences: {all_species_sequences}" )
     logger.info( f"Total DIAMOND jobs: {job_number}" )
     logger.info( f"Job manifest: {output_manifest_path}" )
     logger.info( f"Split files: {splits_directory}" )
@@ -22,11 +22,40 @@ Usage:
 """
 
 import argparse
+import errno
 import logging
+import mmap
+import os
+import re
+import shutil
 import sys
 from pathlib import Path
 
 
+# Newlines are counted in windows of this size over a memory map of each part file
+LINE_COUNT_WINDOW_BYTES = 16 << 20
+
+# Chunk size for the buffered copy used where os.sendfile cannot write to a file
+IO_BUFFER_BYTES = 1 << 20
+
+# Part files whose readahead is requested ahead of the one being copied, so the storage
+# has several reads queued at once instead of one file at a time
+PREFETCH_PARTS = 16
+
+# Part index in DIAMOND result file names ( {species_name}_part_{NNN}_diamond.tsv )
+PART_NUMBER_PATTERN = re.compile( r'_part_(\d+)' )
+
+
+def part_order_key( input_file_path ):
+    """Sort key putting part files in numeric part order, then any other files by path."""
+
+    part_match = PART_NUMBER_PATTERN.search( input_file_path.name )
+    if part_match is None:
+        return ( 1, 0, input_file_path )
+
+    return ( 0, int( part_match.group( 1 ) ), input_file_path )
+
+
 def setup_logging( output_dir ):
     """Configure logging to both console and file."""
 
@@ -44,6 +73,91 @@ def setup_logging( output_dir ):
     return logging.getLogger( __name__ )
 
 
+def prefetch_file( input_file_path ):
+    """Ask the kernel to start reading a file into the page cache (no-op where posix_fadvise is unavailable)."""
+
+    if not hasattr( os, 'posix_fadvise' ):
+        return
+
+    try:
+        input_descriptor = os.open( input_file_path, os.O_RDONLY )
+    except OSError:
+        return
+
+    # The readahead carries on in the background after the descriptor is closed
+    try:
+        os.posix_fadvise( input_descriptor, 0, 0, os.POSIX_FADV_WILLNEED )
+    except OSError:
+        pass
+    finally:
+        os.close( input_descriptor )
+
+
+def advise_file_access( input_file, advice_name ):
+    """Pass an access pattern hint (e.g. 'POSIX_FADV_SEQUENTIAL') for a whole open file; no-op where unsupported."""
+
+    advice = getattr( os, advice_name, None )
+    if advice is None:
+        return
+
+    try:
+        os.posix_fadvise( input_file.fileno(), 0, 0, advice )
+    except OSError:
+        pass
+
+
+def reserve_file_space( output_file, total_bytes ):
+    """Preallocate an output file's blocks with posix_fallocate (skipped where the filesystem cannot)."""
+
+    if total_bytes == 0 or not hasattr( os, 'posix_fallocate' ):
+        return
+
+    try:
+        os.posix_fallocate( output_file.fileno(), 0, total_bytes )
+    except OSError as error:
+        # Filesystems without fallocate support (e.g. some NFS mounts) allocate as data arrives;
+        # anything else, such as a full disk, is a real failure
+        if error.errno not in ( errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL ):
+            raise
+
+
+def append_file_contents( output_file, input_file_path, file_size ):
+    """Append a file's bytes to an unbuffered output file, copied inside the kernel with os.sendfile where possible."""
+
+    with open( input_file_path, 'rb' ) as input_file:
+        advise_file_access( input_file, 'POSIX_FADV_SEQUENTIAL' )
+        offset = 0
+        try:
+            while offset < file_size:
+                bytes_sent = os.sendfile( output_file.fileno(), input_file.fileno(), offset, file_size - offset )
+                if bytes_sent == 0:
+                    break
+                offset += bytes_sent
+        except OSError:
+            # sendfile only writes to regular files on Linux: plain copy of whatever is left
+            input_file.seek( offset )
+            shutil.copyfileobj( input_file, output_file, IO_BUFFER_BYTES )
+
+
+def count_lines( input_file_path, file_size ):
+    """Count the lines in a non-empty file (a final line without a newline counts) without reading it into Python."""
+
+    with open( input_file_path, 'rb' ) as input_file:
+        with mmap.mmap( input_file.fileno(), 0, access = mmap.ACCESS_READ ) as file_buffer:
+            if hasattr( mmap, 'MADV_SEQUENTIAL' ):
+                file_buffer.madvise( mmap.MADV_SEQUENTIAL )
+            line_count = 0
+            for window_start in range( 0, file_size, LINE_COUNT_WINDOW_BYTES ):
+                line_count += file_buffer[ window_start:window_start + LINE_COUNT_WINDOW_BYTES ].count( b'\n' )
+            if file_buffer[ -1: ] != b'\n':
+                line_count += 1
+
+        # Counting is the last read of this part: drop its pages from the page cache
+        advise_file_access( input_file, 'POSIX_FADV_DONTNEED' )
+
+    return line_count
+
+
 def main():
 
     parser = argparse.ArgumentParser( description = "Combine DIAMOND results for one species" )
@@ -68,12 +182,17 @@ def main():
     # Validate input files
     # ========================================================================
 
-    existing_files = []
-    for input_file_path in sorted( input_file_paths ):
-        if input_file_path.exists():
-            existing_files.append( input_file_path )
-        else:
+    # ( input file path, size in bytes ) in combine order; one stat per file both checks it exists and sizes it.
+    # The single sort here orders parts by their numeric index, so the order does not depend on zero padding
+    existing_files_and_sizes = []
+    for input_file_path in sorted( input_file_paths, key = part_order_key ):
+        try:
+            file_size = os.stat( input_file_path ).st_size
+        except ( FileNotFoundError, NotADirectoryError ):
             logger.warning( f"  File not found (skipping): {input_file_path}" )
+            continue
+        existing_files_and_sizes.append( ( input_file_path, file_size ) )
+    existing_files = [ input_file_path for input_file_path, file_size in existing_files_and_sizes ]
 
     if len( existing_files ) == 0:
         logger.error( f"CRITICAL ERROR: No DIAMOND result files found for {species_name}" )
@@ -87,24 +206,39 @@ def main():
     total_hits = 0
     non_empty_parts = 0
 
-    with open( output_file_path, 'w' ) as output_combined:
-        for input_file_path in sorted( existing_files ):
+    part_sizes = [ file_size for input_file_path, file_size in existing_files_and_sizes ]
+
+    for input_file_path in existing_files[ :PREFETCH_PARTS ]:
+        prefetch_file( input_file_path )
+
+    # Unbuffered, so sendfile and the fallback copy both write straight to the file in order
+    with open( output_file_path, 'wb', buffering = 0 ) as output_combined:
+
+        # The combined size is known up front: reserve it in one allocation (less
+        # fragmentation, and a full disk fails here rather than partway through)
+        reserve_file_space( output_combined, sum( part_sizes ) )
+
+        for part_index, ( input_file_path, file_size ) in enumerate( existing_files_and_sizes ):
+
+            # Keep PREFETCH_PARTS parts reading ahead of the copy
+            if part_index + PREFETCH_PARTS < len( existing_files ):
+                prefetch_file( existing_files[ part_index + PREFETCH_PARTS ] )
 
-            file_size = input_file_path.stat().st_size
             if file_size == 0:
                 logger.info( f"  Empty file (skipping): {input_file_path.name}" )
                 continue
 
             non_empty_parts += 1
-            part_hits = 0
 
-            with open( input_file_path, 'r' ) as input_part:
-                for line in input_part:
-                    output_combined.write( line )
-                    part_hits += 1
+            # The hit lines are copied and counted as raw bytes, never decoded into Python strings
+            append_file_contents( output_combined, input_file_path, file_size )
+            part_hits = count_lines( input_file_path, file_size )
 
             total_hits += part_hits
 
+        # Drop any reserved space left unfilled (a part that shrank after it was sized)
+        output_combined.truncate()
+
     # ========================================================================
     # Summary
     # ========================================================================
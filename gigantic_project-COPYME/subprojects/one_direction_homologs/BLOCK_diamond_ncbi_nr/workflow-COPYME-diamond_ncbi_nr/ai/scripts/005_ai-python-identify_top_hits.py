@@ -38,16 +38,31 @@ Usage:
         --input-file OUTPUT_pipeline/4-output/combined_Homo_sapiens.tsv \\
         --output-dir OUTPUT_pipeline/5-output \\
         --species-name Homo_sapiens \\
-        --proteome-file /path/to/Homo_sapiens-T1-proteome.aa
+        --proteome-file /path/to/Homo_sapiens-T1-proteome.aa \\
+        --workers 4
 """
 
 import argparse
-import csv
 import logging
+import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
 
 
+# A self-hit alignment must cover at least this fraction of the full query protein length
+ALIGNMENT_COVERAGE_THRESHOLD = 0.95
+
+# Hits reported per query (DIAMOND writes each query's hits best bitscore first)
+TOP_HITS_COUNT = 10
+
+# Chunk size for appending worker shard files to the top hits file
+IO_BUFFER_BYTES = 1 << 20
+
+
 def setup_logging( output_dir ):
     """Configure logging to both console and file."""
 
@@ -69,20 +84,21 @@ def read_proteome_sequence_lengths( proteome_file_path, logger ):
     """Read proteome FASTA and return dictionary of sequence_id -> length.
 
     Handles multi-line FASTA format. Only uses the first word of the header
-    as the sequence identifier (matching DIAMOND qseqid behavior).
+    as the sequence identifier (matching DIAMOND qseqid behavior). Identifiers
+    are bytes, matching the query IDs from read_diamond_hits.
     """
 
     identifiers___lengths = {}
     current_identifier = None
     current_length = 0
 
-    with open( proteome_file_path, 'r' ) as input_proteome:
+    with open( proteome_file_path, 'rb' ) as input_proteome:
         for line in input_proteome:
             line = line.strip()
             if not line:
                 continue
 
-            if line.startswith( '>' ):
+            if line[ :1 ] == b'>':
                 # Save previous sequence length
                 if current_identifier is not None:
                     identifiers___lengths[ current_identifier ] = current_length
@@ -101,6 +117,239 @@ def read_proteome_sequence_lengths( proteome_file_path, logger ):
     return identifiers___lengths
 
 
+def read_diamond_hits( input_file_path, start_offset = 0, end_offset = None ):
+    """Yield ( query_id, hit ) for every complete line of a 13-column DIAMOND TSV, in file order.
+
+    Only lines starting in [ start_offset, end_offset ) are read (the whole file by default).
+    Each hit tuple is (subject_id, pident, mismatch, gapopen, qstart, qend, evalue, stitle),
+    holding the columns as read; the numeric ones are converted only for the hits
+    the self/non-self scan actually examines (often just the first one or two).
+    The file is read as bytes and the top hits rows are written as bytes, so the
+    columns are never decoded.
+    """
+
+    # qseqid	sseqid	pident	length	mismatch	gapopen	qstart	qend	sstart	send	evalue	bitscore	stitle
+    # g_GENE001-t_T1-p_P1-n_Metazoa_...	XP_012345.1	98.5	500	7	0	1	500	1	500	1e-200	800	hypothetical protein [Homo sapiens]
+    with open( input_file_path, 'rb' ) as input_diamond_results:
+        input_diamond_results.seek( start_offset )
+        line_start = start_offset
+
+        for line in input_diamond_results:
+            if end_offset is not None and line_start >= end_offset:
+                break
+            line_start += len( line )
+
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = line.split( b'\t' )
+
+            # Ensure we have all 13 columns
+            if len( parts ) < 13:
+                continue
+
+            yield parts[ 0 ], (
+                parts[ 1 ],
+                parts[ 2 ],
+                parts[ 4 ],
+                parts[ 5 ],
+                parts[ 6 ],
+                parts[ 7 ],
+                parts[ 10 ],
+                parts[ 12 ]
+            )
+
+
+def find_query_block_start( input_file_path, offset ):
+    """Return the byte offset where the first query block starting after offset begins (end of file if none).
+
+    Splitting the DIAMOND file at these offsets keeps every query's hits in one range.
+    """
+
+    # A cut at the start of the file is already a block start
+    if offset <= 0:
+        return 0
+
+    with open( input_file_path, 'rb' ) as input_diamond_results:
+        # Finish the line that offset falls in; it belongs to the range before
+        input_diamond_results.seek( offset - 1 )
+        input_diamond_results.readline()
+        line_start = input_diamond_results.tell()
+
+        first_query_id = None
+        for line in input_diamond_results:
+            parts = line.strip().split( b'\t' )
+            # Incomplete lines are skipped by read_diamond_hits, so they never start a block
+            if len( parts ) >= 13:
+                if first_query_id is None:
+                    first_query_id = parts[ 0 ]
+                elif parts[ 0 ] != first_query_id:
+                    return line_start
+            line_start += len( line )
+
+    return line_start
+
+
+def quote_field( field ):
+    """Quote a bytes field the way csv.QUOTE_MINIMAL does: only if it holds a double quote or CR (inner quotes doubled)."""
+
+    if b'"' in field or b'\r' in field:
+        return b'"' + field.replace( b'"', b'""' ) + b'"'
+    return field
+
+
+def write_top_hits_rows( input_file_path, start_offset, end_offset, identifiers___lengths, output_top_hits ):
+    """
+    Write one top hits row per query in a byte range of the DIAMOND file to an open binary file.
+
+    Returns ( statistics___counts, query_ids ). Raises ValueError naming the query if a
+    query's hits are not contiguous in the range.
+    """
+
+    # ========================================================================
+    #
+    # Self-hit detection: STRENGTHENED PROXY
+    #
+    # A hit is classified as a self-hit when ALL of these are true:
+    #   1. pident == 100.0 (perfect percent identity)
+    #   2. mismatch == 0 (no mismatches in alignment)
+    #   3. gapopen == 0 (no gaps in alignment)
+    #   4. Alignment covers >= 95% of full query protein length
+    #
+    # Condition 4 prevents false positives from conserved domains shared
+    # between paralogs. A paralog might share a 100%-identical domain,
+    # but the alignment would only cover a fraction of the full protein.
+    #
+    # The 95% threshold (rather than 100%) accounts for minor alignment
+    # edge effects where DIAMOND may not extend to the very first or
+    # last residue.
+    #
+    # ========================================================================
+
+    # Statistics counters
+    total_queries = 0
+    self_hits_found = 0
+    non_self_hits_found = 0
+    queries_with_no_non_self_hits = 0
+    queries_with_no_self_hits = 0
+    queries_with_no_length_lookup = 0
+
+    # DIAMOND writes all hits for a query together, so each query is summarized and
+    # written as soon as its block of lines ends: only one query's hits are held in
+    # memory, and rows come out in DIAMOND (proteome) order
+    completed_query_ids = set()
+
+    for query_id, query_hits in groupby( read_diamond_hits( input_file_path, start_offset, end_offset ), key = itemgetter( 0 ) ):
+
+        if query_id in completed_query_ids:
+            raise ValueError( query_id.decode( 'utf-8', 'replace' ) )
+        completed_query_ids.add( query_id )
+        total_queries += 1
+
+        # Look up full query protein length
+        query_full_length = identifiers___lengths.get( query_id, None )
+        if query_full_length is None:
+            queries_with_no_length_lookup += 1
+
+        # Take top 10 hits (already sorted by DIAMOND by bitscore); only these are kept,
+        # groupby skips the rest of the query's lines
+        hits_top_10 = [ hit for hit_query_id, hit in islice( query_hits, TOP_HITS_COUNT ) ]
+
+        # Collect top 10 IDs, headers, and e-values (e-value at tuple index 6 per
+        # hits_top_10 schema: subject_id, pident, mismatch, gapopen, qstart, qend,
+        # evalue, stitle).
+        top_10_ids = [ hit[ 0 ] for hit in hits_top_10 ]
+        top_10_headers = [ hit[ 7 ] for hit in hits_top_10 ]
+        top_10_evalues = [ hit[ 6 ] for hit in hits_top_10 ]
+
+        # Find top non-self hit and top self-hit
+        top_non_self_hit_id = b""
+        top_non_self_hit_header = b""
+        top_non_self_hit_pident = b""
+        top_self_hit_id = b""
+        top_self_hit_header = b""
+
+        found_non_self = False
+        found_self = False
+
+        for subject_id, pident, mismatch, gapopen, qstart, qend, evalue, stitle in hits_top_10:
+
+            # Check self-hit conditions: perfect identity + near-full-length alignment
+            pident = float( pident )
+            is_perfect_identity = ( pident == 100.0 and int( mismatch ) == 0 and int( gapopen ) == 0 )
+            is_full_length = False
+
+            if is_perfect_identity and query_full_length is not None and query_full_length > 0:
+                # Calculate alignment coverage of query protein
+                query_aligned_length = int( qend ) - int( qstart ) + 1
+                alignment_coverage = query_aligned_length / query_full_length
+                is_full_length = ( alignment_coverage >= ALIGNMENT_COVERAGE_THRESHOLD )
+
+            if is_perfect_identity and is_full_length:
+                # Self-hit: 100% identity over >= 95% of query length
+                if not found_self:
+                    top_self_hit_id = subject_id
+                    top_self_hit_header = stitle
+                    found_self = True
+                    self_hits_found += 1
+            else:
+                # Non-self hit: either imperfect identity or partial alignment
+                if not found_non_self:
+                    top_non_self_hit_id = subject_id
+                    top_non_self_hit_header = stitle
+                    top_non_self_hit_pident = str( pident ).encode( 'ascii' )
+                    found_non_self = True
+                    non_self_hits_found += 1
+
+            # Stop early if both found
+            if found_self and found_non_self:
+                break
+
+        if not found_non_self:
+            queries_with_no_non_self_hits += 1
+        if not found_self:
+            queries_with_no_self_hits += 1
+
+        # Write row
+        fields = (
+            query_id,
+            b", ".join( top_10_ids ),
+            b", ".join( top_10_headers ),
+            b", ".join( top_10_evalues ),
+            top_non_self_hit_id,
+            top_non_self_hit_header,
+            top_non_self_hit_pident,
+            top_self_hit_id,
+            top_self_hit_header,
+            b"alignment_proxy_pident100_mismatch0_gapopen0_coverage95"
+        )
+        output = b'\t'.join( fields )
+        # Readers parse this file with csv (e.g. secretome STEP_2 script 006), so the
+        # rare row with a double quote in an NCBI title is quoted as csv.writer did
+        if b'"' in output or b'\r' in output:
+            output = b'\t'.join( [ quote_field( field ) for field in fields ] )
+        output_top_hits.write( output + b'\n' )
+
+    statistics___counts = {
+        'total_queries': total_queries,
+        'self_hits_found': self_hits_found,
+        'non_self_hits_found': non_self_hits_found,
+        'queries_with_no_non_self_hits': queries_with_no_non_self_hits,
+        'queries_with_no_self_hits': queries_with_no_self_hits,
+        'queries_with_no_length_lookup': queries_with_no_length_lookup
+    }
+
+    return statistics___counts, completed_query_ids
+
+
+def write_top_hits_shard( input_file_path, start_offset, end_offset, identifiers___lengths, shard_file_path ):
+    """Worker process entry point: write one byte range's top hits rows to a shard file."""
+
+    with open( shard_file_path, 'wb' ) as output_shard:
+        return write_top_hits_rows( input_file_path, start_offset, end_offset, identifiers___lengths, output_shard )
+
+
 def main():
 
     parser = argparse.ArgumentParser( description = "Identify top self/non-self hits from DIAMOND results" )
@@ -108,6 +357,8 @@ def main():
     parser.add_argument( "--output-dir", required = True, help = "Output directory" )
     parser.add_argument( "--species-name", required = True, help = "Species name" )
     parser.add_argument( "--proteome-file", required = True, help = "Proteome FASTA file for query length lookup" )
+    parser.add_argument( "--workers", type = int, default = 1,
+                         help = "Worker processes, each taking a contiguous range of queries (default: 1)" )
     arguments = parser.parse_args()
 
     input_file_path = Path( arguments.input_file )
@@ -131,7 +382,8 @@ def main():
         logger.error( f"CRITICAL ERROR: Input file not found: {input_file_path}" )
         sys.exit( 1 )
 
-    if input_file_path.stat().st_size == 0:
+    input_file_size = input_file_path.stat().st_size
+    if input_file_size == 0:
         logger.error( f"CRITICAL ERROR: Input file is empty: {input_file_path}" )
         sys.exit( 1 )
 
@@ -147,192 +399,110 @@ def main():
 
     identifiers___lengths = read_proteome_sequence_lengths( proteome_file_path, logger )
 
-    # ========================================================================
-    # Read DIAMOND results and group by query
-    # ========================================================================
-    # Dictionary: query_id -> list of hit tuples
-    # Each hit tuple: (subject_id, pident, length, mismatch, gapopen,
-    #                  qstart, qend, evalue, bitscore, stitle)
-
-    queries___hits = {}
-
-    # qseqid	sseqid	pident	length	mismatch	gapopen	qstart	qend	sstart	send	evalue	bitscore	stitle
-    # g_GENE001-t_T1-p_P1-n_Metazoa_...	XP_012345.1	98.5	500	7	0	1	500	1	500	1e-200	800	hypothetical protein [Homo sapiens]
-    with open( input_file_path, 'r' ) as input_diamond_results:
-        for line in input_diamond_results:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = line.split( '\t' )
-
-            # Ensure we have all 13 columns
-            if len( parts ) < 13:
-                continue
-
-            query_id = parts[ 0 ]
-            subject_id = parts[ 1 ]
-            pident = float( parts[ 2 ] )
-            alignment_length = int( parts[ 3 ] )
-            mismatch = int( parts[ 4 ] )
-            gapopen = int( parts[ 5 ] )
-            qstart = int( parts[ 6 ] )
-            qend = int( parts[ 7 ] )
-            evalue = parts[ 10 ]
-            bitscore = parts[ 11 ]
-            stitle = parts[ 12 ]
-
-            if query_id not in queries___hits:
-                queries___hits[ query_id ] = []
-
-            queries___hits[ query_id ].append( (
-                subject_id,
-                pident,
-                alignment_length,
-                mismatch,
-                gapopen,
-                qstart,
-                qend,
-                evalue,
-                bitscore,
-                stitle
-            ) )
-
-    total_queries = len( queries___hits )
-    logger.info( f"Unique query sequences: {total_queries}" )
-
     # ========================================================================
     # Identify top hits for each query
     # ========================================================================
-    #
-    # Self-hit detection: STRENGTHENED PROXY
-    #
-    # A hit is classified as a self-hit when ALL of these are true:
-    #   1. pident == 100.0 (perfect percent identity)
-    #   2. mismatch == 0 (no mismatches in alignment)
-    #   3. gapopen == 0 (no gaps in alignment)
-    #   4. Alignment covers >= 95% of full query protein length
-    #
-    # Condition 4 prevents false positives from conserved domains shared
-    # between paralogs. A paralog might share a 100%-identical domain,
-    # but the alignment would only cover a fraction of the full protein.
-    #
-    # The 95% threshold (rather than 100%) accounts for minor alignment
-    # edge effects where DIAMOND may not extend to the very first or
-    # last residue.
-    #
-    # ========================================================================
-
-    ALIGNMENT_COVERAGE_THRESHOLD = 0.95
 
-    # Statistics counters
-    self_hits_found = 0
-    non_self_hits_found = 0
-    queries_with_no_non_self_hits = 0
-    queries_with_no_self_hits = 0
-    queries_with_no_length_lookup = 0
+    # Split the DIAMOND file into one byte range per worker, each cut moved to the
+    # next query block start so no query is divided between workers (at most one
+    # worker per byte, so every cut point is past the start of the file)
+    worker_count = max( 1, min( arguments.workers, input_file_size ) )
+    range_boundaries = [ 0 ]
+    for worker_index in range( 1, worker_count ):
+        block_start = find_query_block_start( input_file_path, input_file_size * worker_index // worker_count )
+        if block_start > range_boundaries[ -1 ]:
+            range_boundaries.append( block_start )
+    if range_boundaries[ -1 ] < input_file_size:
+        range_boundaries.append( input_file_size )
+    byte_ranges = list( zip( range_boundaries[ :-1 ], range_boundaries[ 1: ] ) )
+
+    logger.info( f"Worker processes: {len( byte_ranges )}" )
 
     # Output file paths
     output_top_hits_path = output_directory / f"{species_name}_top_hits.tsv"
     output_statistics_path = output_directory / f"{species_name}_statistics.tsv"
 
-    with open( output_top_hits_path, 'w', newline = '', encoding = 'utf-8' ) as output_top_hits:
+    statistics___counts = {
+        'total_queries': 0,
+        'self_hits_found': 0,
+        'non_self_hits_found': 0,
+        'queries_with_no_non_self_hits': 0,
+        'queries_with_no_self_hits': 0,
+        'queries_with_no_length_lookup': 0
+    }
 
-        writer = csv.writer( output_top_hits, delimiter = '\t', quoting = csv.QUOTE_MINIMAL )
+    # Rows are written as raw bytes straight from the DIAMOND columns. Every field
+    # comes from a tab-split, stripped line, so none can hold a tab or newline; only
+    # fields with a double quote need quoting (see quote_field)
+    with open( output_top_hits_path, 'wb' ) as output_top_hits:
 
         # Write header
-        writer.writerow( [
-            "Query_Sequence_ID (query protein identifier from species proteome)",
-            "Top_10_Hit_IDs (comma delimited list of top 10 NCBI nr hit sequence IDs)",
-            "Top_10_Hit_Headers (comma delimited list of top 10 NCBI nr hit descriptions)",
-            "Top_10_Hit_E_Values (comma delimited list of top 10 NCBI nr hit DIAMOND BLASTp e-values matched 1:1 with Top_10_Hit_IDs)",
-            "Top_Non_Self_Hit_ID (sequence ID of first hit classified as non-self)",
-            "Top_Non_Self_Hit_Header (NCBI description of top non-self hit)",
-            "Top_Non_Self_Hit_Percent_Identity (percent identity of top non-self hit)",
-            "Top_Self_Hit_ID (sequence ID of first hit classified as self with 100 percent identity and full-length alignment)",
-            "Top_Self_Hit_Header (NCBI description of top self hit)",
-            "Self_Hit_Classification_Method (alignment proxy with pident 100 mismatch 0 gapopen 0 and alignment coverage >= 95 percent of query length)"
-        ] )
-
-        for query_id in sorted( queries___hits.keys() ):
-
-            hits = queries___hits[ query_id ]
-
-            # Look up full query protein length
-            query_full_length = identifiers___lengths.get( query_id, None )
-            if query_full_length is None:
-                queries_with_no_length_lookup += 1
-
-            # Take top 10 hits (already sorted by DIAMOND by bitscore)
-            hits_top_10 = hits[ :10 ]
-
-            # Collect top 10 IDs, headers, and e-values (e-value at tuple index 7 per
-            # hits_top_10 schema: subject_id, pident, alignment_length, mismatch,
-            # gapopen, qstart, qend, evalue, bitscore, stitle).
-            top_10_ids = [ hit[ 0 ] for hit in hits_top_10 ]
-            top_10_headers = [ hit[ 9 ] for hit in hits_top_10 ]
-            top_10_evalues = [ str( hit[ 7 ] ) for hit in hits_top_10 ]
-
-            # Find top non-self hit and top self-hit
-            top_non_self_hit_id = ""
-            top_non_self_hit_header = ""
-            top_non_self_hit_pident = ""
-            top_self_hit_id = ""
-            top_self_hit_header = ""
-
-            found_non_self = False
-            found_self = False
-
-            for subject_id, pident, alignment_length, mismatch, gapopen, qstart, qend, evalue, bitscore, stitle in hits_top_10:
-
-                # Check self-hit conditions: perfect identity + near-full-length alignment
-                is_perfect_identity = ( pident == 100.0 and mismatch == 0 and gapopen == 0 )
-                is_full_length = False
-
-                if is_perfect_identity and query_full_length is not None and query_full_length > 0:
-                    # Calculate alignment coverage of query protein
-                    query_aligned_length = qend - qstart + 1
-                    alignment_coverage = query_aligned_length / query_full_length
-                    is_full_length = ( alignment_coverage >= ALIGNMENT_COVERAGE_THRESHOLD )
-
-                if is_perfect_identity and is_full_length:
-                    # Self-hit: 100% identity over >= 95% of query length
-                    if not found_self:
-                        top_self_hit_id = subject_id
-                        top_self_hit_header = stitle
-                        found_self = True
-                        self_hits_found += 1
-                else:
-                    # Non-self hit: either imperfect identity or partial alignment
-                    if not found_non_self:
-                        top_non_self_hit_id = subject_id
-                        top_non_self_hit_header = stitle
-                        top_non_self_hit_pident = str( pident )
-                        found_non_self = True
-                        non_self_hits_found += 1
-
-                # Stop early if both found
-                if found_self and found_non_self:
-                    break
-
-            if not found_non_self:
-                queries_with_no_non_self_hits += 1
-            if not found_self:
-                queries_with_no_self_hits += 1
-
-            # Write row
-            writer.writerow( [
-                query_id,
-                ", ".join( top_10_ids ),
-                ", ".join( top_10_headers ),
-                ", ".join( top_10_evalues ),
-                top_non_self_hit_id,
-                top_non_self_hit_header,
-                top_non_self_hit_pident,
-                top_self_hit_id,
-                top_self_hit_header,
-                "alignment_proxy_pident100_mismatch0_gapopen0_coverage95"
-            ] )
+        output = "Query_Sequence_ID (query protein identifier from species proteome)\t"
+        output += "Top_10_Hit_IDs (comma delimited list of top 10 NCBI nr hit sequence IDs)\t"
+        output += "Top_10_Hit_Headers (comma delimited list of top 10 NCBI nr hit descriptions)\t"
+        output += "Top_10_Hit_E_Values (comma delimited list of top 10 NCBI nr hit DIAMOND BLASTp e-values matched 1:1 with Top_10_Hit_IDs)\t"
+        output += "Top_Non_Self_Hit_ID (sequence ID of first hit classified as non-self)\t"
+        output += "Top_Non_Self_Hit_Header (NCBI description of top non-self hit)\t"
+        output += "Top_Non_Self_Hit_Percent_Identity (percent identity of top non-self hit)\t"
+        output += "Top_Self_Hit_ID (sequence ID of first hit classified as self with 100 percent identity and full-length alignment)\t"
+        output += "Top_Self_Hit_Header (NCBI description of top self hit)\t"
+        output += "Self_Hit_Classification_Method (alignment proxy with pident 100 mismatch 0 gapopen 0 and alignment coverage >= 95 percent of query length)\n"
+        output_top_hits.write( output.encode( 'utf-8' ) )
+        output_top_hits.flush()
+
+        shard_file_paths = []
+        try:
+            if len( byte_ranges ) <= 1:
+                range_results = [ write_top_hits_rows( input_file_path, 0, None, identifiers___lengths, output_top_hits ) ]
+            else:
+                # Each worker writes its rows to a shard file; the shards are appended in
+                # range order, so the rows keep DIAMOND order
+                shard_file_paths = [
+                    output_directory / f"{species_name}_top_hits.tsv.shard_{range_index:03d}"
+                    for range_index in range( len( byte_ranges ) )
+                ]
+
+                with ProcessPoolExecutor( max_workers = len( byte_ranges ) ) as executor:
+                    range_results = list( executor.map(
+                        write_top_hits_shard,
+                        [ input_file_path ] * len( byte_ranges ),
+                        [ start_offset for start_offset, end_offset in byte_ranges ],
+                        [ end_offset for start_offset, end_offset in byte_ranges ],
+                        [ identifiers___lengths ] * len( byte_ranges ),
+                        shard_file_paths
+                    ) )
+
+                for shard_file_path in shard_file_paths:
+                    with open( shard_file_path, 'rb' ) as input_shard:
+                        shutil.copyfileobj( input_shard, output_top_hits, IO_BUFFER_BYTES )
+                    os.unlink( shard_file_path )
+
+        except ValueError as error:
+            for shard_file_path in shard_file_paths:
+                shard_file_path.unlink( missing_ok = True )
+            logger.error( f"CRITICAL ERROR: Hits for query {error} are not contiguous in {input_file_path}" )
+            logger.error( "Expected DIAMOND output, where all hits of a query are written together." )
+            sys.exit( 1 )
+
+    # A query in two ranges would also be non-contiguous
+    all_query_ids = set()
+    for range_counts, range_query_ids in range_results:
+        if not all_query_ids.isdisjoint( range_query_ids ):
+            query_id = next( iter( all_query_ids & range_query_ids ) )
+            logger.error( f"CRITICAL ERROR: Hits for query {query_id.decode( 'utf-8', 'replace' )} are not contiguous in {input_file_path}" )
+            logger.error( "Expected DIAMOND output, where all hits of a query are written together." )
+            sys.exit( 1 )
+        all_query_ids.update( range_query_ids )
+
+        for statistic_name, count in range_counts.items():
+            statistics___counts[ statistic_name ] += count
+
+    total_queries = statistics___counts[ 'total_queries' ]
+    self_hits_found = statistics___counts[ 'self_hits_found' ]
+    non_self_hits_found = statistics___counts[ 'non_self_hits_found' ]
+    queries_with_no_non_self_hits = statistics___counts[ 'queries_with_no_non_self_hits' ]
+    queries_with_no_self_hits = statistics___counts[ 'queries_with_no_self_hits' ]
+    queries_with_no_length_lookup = statistics___counts[ 'queries_with_no_length_lookup' ]
 
     # ========================================================================
     # Write statistics
@@ -362,6 +532,7 @@ def main():
     # Summary
     # ========================================================================
 
+    logger.info( f"Unique query sequences: {total_queries}" )
     logger.info( "" )
     logger.info( f"Results for {species_name}:" )
     logger.info( f"  Total queries: {total_queries}" )
@@ -79,19 +79,21 @@ def main():
 
         # Species_Name	Total_Queries_Processed	Self_Hits_Found	Non_Self_Hits_Found	...
         # Homo_sapiens	20000	18500	19200	800	1500
+        # Only the header and data lines are read; nothing else in the file is loaded
         with open( input_file_path, 'r' ) as input_statistics:
-            lines = input_statistics.readlines()
-
-            if len( lines ) < 2:
+            try:
+                header_line = next( input_statistics )
+                data_line = next( input_statistics )
+            except StopIteration:
                 logger.warning( f"  Incomplete file (skipping): {input_file_path}" )
                 continue
 
             # Capture header from first file
             if header_row is None:
-                header_row = lines[ 0 ].strip()
+                header_row = header_line.strip()
 
             # Capture data row
-            data_row = lines[ 1 ].strip()
+            data_row = data_line.strip()
             if data_row:
                 data_rows.append( data_row )
                 species_name = data_row.split( '\t' )[ 0 ]
@@ -0,0 +1,45 @@
+# AI: Claude Code | Opus 4.6 | 2026 October 16 | Purpose: Shared FASTA scanning helpers for scripts 001 and 002
+# Human: Eric Edsinger
+
+"""
+Shared FASTA scanning helpers for the diamond_ncbi_nr workflow.
+
+Script 001 (validate proteomes) and script 002 (split proteomes) both need the
+number of records in whole proteome files. The count here runs over a memory map
+with bytes.count, so the work happens in C rather than one Python iteration per
+line, and memory stays bounded by the count window.
+
+A header is a line whose first byte is '>' (the start of the file or right after
+a newline); script 002 splits on exactly that rule so its counts always agree.
+"""
+
+import mmap
+import os
+
+
+# Headers are counted as b'\n>' occurrences in windows of this size (plus one byte of
+# overlap), so the count runs in C with bounded memory however large the proteome is
+HEADER_COUNT_WINDOW_BYTES = 16 << 20
+
+
+def count_fasta_records( fasta_path ):
+    """Count the records (header lines) in a FASTA file without parsing it line by line."""
+
+    with open( fasta_path, 'rb' ) as input_fasta:
+        file_size = os.fstat( input_fasta.fileno() ).st_size
+        # An empty file cannot be memory mapped
+        if file_size == 0:
+            return 0
+
+        with mmap.mmap( input_fasta.fileno(), 0, access = mmap.ACCESS_READ ) as fasta_buffer:
+            # Read once front to back: ask for aggressive readahead
+            if hasattr( mmap, 'MADV_SEQUENTIAL' ):
+                fasta_buffer.madvise( mmap.MADV_SEQUENTIAL )
+
+            # Every header starts the file or follows a newline
+            record_count = 1 if fasta_buffer[ :1 ] == b'>' else 0
+            for window_start in range( 0, file_size, HEADER_COUNT_WINDOW_BYTES ):
+                window_end = window_start + HEADER_COUNT_WINDOW_BYTES + 1
+                record_count += fasta_buffer[ window_start:window_end ].count( b'\n>' )
+
+    return record_count
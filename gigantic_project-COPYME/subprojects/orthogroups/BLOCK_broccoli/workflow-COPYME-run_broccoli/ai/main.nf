@@ -55,7 +55,8 @@ process convert_headers {
     """
     python3 ${scripts_dir}/002_ai-python-convert_headers_to_short_ids.py \
         --proteome-list ${proteome_list} \
-        --output-dir .
+        --output-dir . \
+        --workers ${task.cpus}
     """
 }
 
@@ -27,14 +27,27 @@ Output:
 Usage:
     python3 002_ai-python-convert_headers_to_short_ids.py \\
         --proteome-list OUTPUT_pipeline/1-output/1_ai-proteome_list.tsv
+
+    # Convert 8 proteomes at a time
+    python3 002_ai-python-convert_headers_to_short_ids.py \\
+        --proteome-list OUTPUT_pipeline/1-output/1_ai-proteome_list.tsv \\
+        --workers 8
 """
 
 import argparse
 import logging
+import mmap
+import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
+# 1 MiB output buffer; records are written as a few large blocks each
+IO_BUFFER_BYTES = 1 << 20
+
+
 def setup_logging( output_directory: Path ) -> logging.Logger:
     """Configure logging to both console and file."""
 
@@ -59,86 +72,151 @@ def setup_logging( output_directory: Path ) -> logging.Logger:
     return logger
 
 
+def iter_fasta_records( fasta_data: bytes ):
+    """
+    Yield ( header, sequence_block ) for each record of in-memory FASTA bytes.
+
+    header is the header line without '>' and newline; sequence_block is the record's
+    sequence lines exactly as they appear, newlines included. Anything before the
+    first header is skipped.
+    """
+
+    if fasta_data[ :1 ] == b'>':
+        header_start = 0
+    else:
+        header_start = fasta_data.find( b'\n>' )
+        if header_start == -1:
+            return
+        header_start += 1
+
+    while True:
+        header_end = fasta_data.find( b'\n', header_start )
+        if header_end == -1:
+            yield fasta_data[ header_start + 1: ], b''
+            return
+
+        next_header_start = fasta_data.find( b'\n>', header_end )
+        if next_header_start == -1:
+            yield fasta_data[ header_start + 1:header_end ], fasta_data[ header_end + 1: ]
+            return
+
+        yield fasta_data[ header_start + 1:header_end ], fasta_data[ header_end + 1:next_header_start + 1 ]
+        header_start = next_header_start + 1
+
+
+def iter_fasta_records_universal_newlines( proteome_path: Path ):
+    """
+    Yield ( header, sequence_block ) like iter_fasta_records, reading the file line by line.
+
+    Text mode turns CRLF and bare CR line endings into '\n'. This path is used for
+    proteomes that contain '\r'; only one record is held in memory at a time.
+    """
+
+    header = None
+    sequence_lines = []
+
+    # surrogateescape round-trips any byte that is not valid UTF-8 unchanged
+    with open( proteome_path, 'r', encoding = 'utf-8', errors = 'surrogateescape' ) as input_fasta:
+        for line in input_fasta:
+            if line.startswith( '>' ):
+                if header is not None:
+                    yield header, ''.join( sequence_lines ).encode( 'utf-8', 'surrogateescape' )
+                header = line[ 1: ].rstrip( '\n' ).encode( 'utf-8', 'surrogateescape' )
+                sequence_lines = []
+            elif header is not None:
+                sequence_lines.append( line )
+
+    if header is not None:
+        yield header, ''.join( sequence_lines ).encode( 'utf-8', 'surrogateescape' )
+
+
 def convert_proteome_headers(
     proteome_path: Path,
     genus_species: str,
     output_directory: Path,
     original_filename: str,
+    output_mapping,
     logger: logging.Logger
-) -> list:
+) -> int:
     """
     Convert a single proteome file to short header format.
 
-    Returns list of mapping records.
+    Mapping rows are written straight to output_mapping (the open binary mapping TSV)
+    as each header is converted, so nothing is held in memory per sequence.
+
+    Returns the number of sequences converted.
     """
 
-    mapping_records = []
     sequence_index = 0
-    current_header = None
-    current_sequence_lines = []
+
+    # Genus_Species and Original_Filename columns are the same for every row of this proteome
+    mapping_row_suffix = b'\t' + genus_species.encode() + b'\t' + original_filename.encode() + b'\n'
+
+    # Short IDs are this prefix plus the sequence number
+    short_id_prefix = genus_species.encode() + b'-'
 
     # OrthoHMM requires .fa, .faa, .fas, .fasta, .pep, or .prot extensions
     # Use .pep (peptide FASTA extension)
     output_file = output_directory / f'{genus_species}.pep'
 
-    with open( proteome_path, 'r' ) as input_fasta:
-        with open( output_file, 'w' ) as output_fasta:
+    # The proteome is memory mapped and scanned for header lines with bytes.find (in C);
+    # each header is replaced by the next short ID and the record's sequence lines are
+    # copied through in one write, whatever their line layout
+    with open( proteome_path, 'rb' ) as input_fasta:
+        with open( output_file, 'wb', buffering = IO_BUFFER_BYTES ) as output_fasta:
+
+            # An empty proteome cannot be memory mapped (and has nothing to convert)
+            if os.fstat( input_fasta.fileno() ).st_size > 0:
+                with mmap.mmap( input_fasta.fileno(), 0, access = mmap.ACCESS_READ ) as fasta_buffer:
 
-            for line in input_fasta:
-                line = line.rstrip( '\n' )
+                    # CRLF (or bare CR) line endings are written as '\n': such proteomes are
+                    # streamed record by record through text mode rather than copied whole
+                    if fasta_buffer.find( b'\r' ) == -1:
+                        fasta_records = iter_fasta_records( fasta_buffer )
+                    else:
+                        fasta_records = iter_fasta_records_universal_newlines( proteome_path )
 
-                if line.startswith( '>' ):
-                    # Write previous sequence if exists
-                    if current_header is not None:
+                    for header, sequence_block in fasta_records:
                         sequence_index += 1
-                        short_id = f'{genus_species}-{sequence_index}'
+                        short_id = short_id_prefix + b'%d' % sequence_index
 
                         # Write to output FASTA
-                        output = '>' + short_id + '\n'
+                        output = b'>' + short_id + b'\n'
                         output_fasta.write( output )
 
-                        for sequence_line in current_sequence_lines:
-                            output = sequence_line + '\n'
-                            output_fasta.write( output )
-
-                        # Record mapping
-                        mapping_records.append( {
-                            'short_id': short_id,
-                            'original_header': current_header,
-                            'genus_species': genus_species,
-                            'original_filename': original_filename
-                        } )
-
-                    # Start new sequence
-                    current_header = line[ 1: ]  # Remove '>'
-                    current_sequence_lines = []
-
-                else:
-                    # Sequence line
-                    current_sequence_lines.append( line )
-
-            # Write final sequence
-            if current_header is not None:
-                sequence_index += 1
-                short_id = f'{genus_species}-{sequence_index}'
-
-                output = '>' + short_id + '\n'
-                output_fasta.write( output )
-
-                for sequence_line in current_sequence_lines:
-                    output = sequence_line + '\n'
-                    output_fasta.write( output )
-
-                mapping_records.append( {
-                    'short_id': short_id,
-                    'original_header': current_header,
-                    'genus_species': genus_species,
-                    'original_filename': original_filename
-                } )
+                        if sequence_block:
+                            output_fasta.write( sequence_block )
+                            # Only the last record can lack a final newline
+                            if not sequence_block.endswith( b'\n' ):
+                                output_fasta.write( b'\n' )
+
+                        # Write mapping row
+                        output = short_id + b'\t' + header + mapping_row_suffix
+                        output_mapping.write( output )
 
     logger.debug( f"  {genus_species}: {sequence_index} sequences converted" )
 
-    return mapping_records
+    return sequence_index
+
+
+def convert_proteome_headers_to_shard(
+    proteome_path: Path,
+    genus_species: str,
+    output_directory: Path,
+    original_filename: str,
+    shard_file_path: Path
+) -> int:
+    """Worker process entry point: convert one proteome, writing its mapping rows to a shard file."""
+
+    with open( shard_file_path, 'wb', buffering = IO_BUFFER_BYTES ) as output_shard:
+        return convert_proteome_headers(
+            proteome_path = proteome_path,
+            genus_species = genus_species,
+            output_directory = output_directory,
+            original_filename = original_filename,
+            output_mapping = output_shard,
+            logger = logging.getLogger( '002_convert_headers' )
+        )
 
 
 def main():
@@ -162,6 +240,13 @@ def main():
         help = 'Output directory (default: OUTPUT_pipeline/2-output)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type = int,
+        default = 1,
+        help = 'Worker processes, each converting one proteome at a time (default: 1)'
+    )
+
     arguments = parser.parse_args()
 
     # Convert to Path objects
@@ -191,8 +276,7 @@ def main():
     # Proteome_Filename (proteome file name)	Full_Path (absolute path to proteome file)	Genus_Species (extracted from phyloname)	Sequence_Count (number of protein sequences in file)
     # Metazoa_Chordata_Mammalia_Primates_Hominidae_Homo_sapiens-T1-proteome.aa	/full/path/to/file.aa	Homo_sapiens	20000
 
-    all_mapping_records = []
-    proteome_count = 0
+    proteome_tasks = []
     total_sequences = 0
     genus_species_seen = set()
 
@@ -230,40 +314,70 @@ def main():
                 logger.error( f"CRITICAL ERROR: Proteome file not found: {proteome_path}" )
                 sys.exit( 1 )
 
-            # Convert headers
-            mapping_records = convert_proteome_headers(
-                proteome_path = proteome_path,
-                genus_species = genus_species,
-                output_directory = short_header_directory,
-                original_filename = filename,
-                logger = logger
-            )
+            proteome_tasks.append( ( proteome_path, genus_species, filename ) )
 
-            all_mapping_records.extend( mapping_records )
-            proteome_count += 1
-            total_sequences += len( mapping_records )
+    # ========================================================================
+    # Convert headers
+    # ========================================================================
 
-    logger.info( f"Processed {proteome_count} proteomes" )
-    logger.info( f"Total sequences converted: {total_sequences}" )
+    worker_count = max( 1, min( arguments.workers, len( proteome_tasks ) ) )
+    logger.info( f"Worker processes: {worker_count}" )
 
-    # Write mapping file
+    # The mapping file is only created once the whole proteome list has validated;
+    # rows are written as each proteome is converted, after the header
     mapping_file = output_directory / '2_ai-header_mapping.tsv'
 
-    with open( mapping_file, 'w' ) as output_mapping:
-        # Write header
+    with open( mapping_file, 'wb', buffering = IO_BUFFER_BYTES ) as output_mapping:
+
         header = 'Short_ID (short header format Genus_species-N)' + '\t'
         header += 'Original_Header (full GIGANTIC protein identifier)' + '\t'
         header += 'Genus_Species (species name)' + '\t'
         header += 'Original_Filename (source proteome file)' + '\n'
-        output_mapping.write( header )
-
-        # Write data rows
-        for record in all_mapping_records:
-            output = record[ 'short_id' ] + '\t'
-            output += record[ 'original_header' ] + '\t'
-            output += record[ 'genus_species' ] + '\t'
-            output += record[ 'original_filename' ] + '\n'
-            output_mapping.write( output )
+        output_mapping.write( header.encode() )
+
+        if worker_count == 1:
+            for proteome_path, genus_species, filename in proteome_tasks:
+                total_sequences += convert_proteome_headers(
+                    proteome_path = proteome_path,
+                    genus_species = genus_species,
+                    output_directory = short_header_directory,
+                    original_filename = filename,
+                    output_mapping = output_mapping,
+                    logger = logger
+                )
+
+        else:
+            # Each proteome's mapping rows go to its own shard file; the shards are appended
+            # in proteome list order, so the mapping file is the same as a serial run's
+            output_mapping.flush()
+            shard_file_paths = [
+                output_directory / f'2_ai-header_mapping.tsv.shard_{task_index:04d}'
+                for task_index in range( len( proteome_tasks ) )
+            ]
+
+            try:
+                with ProcessPoolExecutor( max_workers = worker_count ) as executor:
+                    total_sequences = sum( executor.map(
+                        convert_proteome_headers_to_shard,
+                        [ proteome_path for proteome_path, genus_species, filename in proteome_tasks ],
+                        [ genus_species for proteome_path, genus_species, filename in proteome_tasks ],
+                        [ short_header_directory ] * len( proteome_tasks ),
+                        [ filename for proteome_path, genus_species, filename in proteome_tasks ],
+                        shard_file_paths
+                    ) )
+
+                for shard_file_path in shard_file_paths:
+                    with open( shard_file_path, 'rb' ) as input_shard:
+                        shutil.copyfileobj( input_shard, output_mapping, IO_BUFFER_BYTES )
+                    os.unlink( shard_file_path )
+
+            except Exception:
+                for shard_file_path in shard_file_paths:
+                    shard_file_path.unlink( missing_ok = True )
+                raise
+
+    logger.info( f"Processed {len( proteome_tasks )} proteomes" )
+    logger.info( f"Total sequences converted: {total_sequences}" )
 
     logger.info( f"Wrote header mapping to: {mapping_file}" )
     logger.info( f"Short-header proteomes written to: {short_header_directory}" )
@@ -145,7 +145,8 @@ process convert_headers {
 
     python3 ${projectDir}/scripts/002_ai-python-convert_headers_to_short_ids.py \\
         --proteome-list ${proteome_list} \\
-        --output-dir 2-output
+        --output-dir 2-output \\
+        --workers ${task.cpus}
     """
 }
 